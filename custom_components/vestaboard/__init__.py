@@ -7,14 +7,32 @@ import logging
 from homeassistant.components import notify as hass_notify
 from homeassistant.const import CONF_NAME, Platform
 from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.exceptions import ConfigEntryNotReady, HomeAssistantError
 from homeassistant.helpers import discovery
 from homeassistant.helpers.typing import ConfigType
 
-from .const import DATA_HASS_CONFIG, DOMAIN
-from .coordinator import VestaboardConfigEntry, VestaboardCoordinator
+from .compiled import CompiledMessages
+from .const import (
+    CONF_BOARDS,
+    DATA_COMPILED,
+    DATA_HASS_CONFIG,
+    DATA_RENDERER,
+    DATA_TILE_ART,
+    DOMAIN,
+)
+from .coordinator import (
+    VestaboardConfigEntry,
+    VestaboardCoordinator,
+    async_get_state_store,
+)
 from .helpers import create_client
+from .playlist import async_get_playlist_store
+from .render import VestaboardRenderer
 from .services import async_setup_services
+from .tile_art import TileArtConverter
+from .views import async_setup_views
+from .wall import VestaboardWall, VestaboardWallConfigEntry
+from .websocket_api import async_setup_websocket_api
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,25 +42,46 @@ PLATFORMS = [
     Platform.IMAGE,
     Platform.SENSOR,
 ]
+WALL_PLATFORMS = [Platform.IMAGE]
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the Vestaboard integration."""
     async_setup_services(hass)
-    hass.data[DOMAIN] = {DATA_HASS_CONFIG: config}
+    async_setup_views(hass)
+    async_setup_websocket_api(hass)
+    renderer = VestaboardRenderer(hass)
+    renderer.async_setup()
+    hass.data[DOMAIN] = {
+        DATA_COMPILED: CompiledMessages(),
+        DATA_HASS_CONFIG: config,
+        DATA_RENDERER: renderer,
+        DATA_TILE_ART: TileArtConverter(hass),
+    }
     return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: VestaboardConfigEntry) -> bool:
     """Set up Vestaboard from a config entry."""
+    if CONF_BOARDS in entry.data:
+        return await async_setup_wall_entry(hass, entry)
+
     client = create_client(entry.data)
     coordinator = VestaboardCoordinator(hass, entry, client)
-    await coordinator.async_config_entry_first_refresh()
+    coordinator.async_setup_quiet_hours()
+    entry.runtime_data = coordinator
 
-    if not coordinator.data:
-        raise ConfigEntryNotReady
+    if await coordinator.async_restore_state():
+        # Entities start from the last known state while the board is read
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), "vestaboard first refresh"
+        )
+    else:
+        await coordinator.async_config_entry_first_refresh()
+        if not coordinator.data:
+            raise ConfigEntryNotReady
 
-    entry.runtime_data = coordinator
+    await coordinator.playlists.async_load()
 
     hass.async_create_task(
         discovery.async_load_platform(
@@ -58,16 +97,45 @@ async def async_setup_entry(hass: HomeAssistant, entry: VestaboardConfigEntry) -
 
     entry.async_on_unload(entry.add_update_listener(update_listener))
 
+    # Walls hold on to the coordinators of their boards, so pick up the new one
+    for wall in hass.config_entries.async_loaded_entries(DOMAIN):
+        if entry.entry_id in wall.data.get(CONF_BOARDS, ()):
+            hass.config_entries.async_schedule_reload(wall.entry_id)
+
+    return True
+
+
+async def async_setup_wall_entry(
+    hass: HomeAssistant, entry: VestaboardWallConfigEntry
+) -> bool:
+    """Set up a wall of Vestaboards from a config entry."""
+    wall = VestaboardWall(hass, entry)
+    try:
+        wall.async_setup()
+    except HomeAssistantError as err:
+        raise ConfigEntryNotReady(err) from err
+    entry.runtime_data = wall
+    entry.async_on_unload(wall.async_unload)
+    await hass.config_entries.async_forward_entry_setups(entry, WALL_PLATFORMS)
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: VestaboardConfigEntry) -> bool:
     """Unload a config entry."""
+    if CONF_BOARDS in entry.data:
+        return await hass.config_entries.async_unload_platforms(entry, WALL_PLATFORMS)
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         await hass_notify.async_reload(hass, DOMAIN)
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: VestaboardConfigEntry) -> None:
+    """Remove the stored state and playlists of a removed board."""
+    if CONF_BOARDS not in entry.data:
+        await async_get_state_store(hass, entry.entry_id).async_remove()
+        await async_get_playlist_store(hass, entry.entry_id).async_remove()
+
+
 async def update_listener(hass: HomeAssistant, entry: VestaboardConfigEntry) -> None:
     """Handle options update."""
     await hass.config_entries.async_reload(entry.entry_id)
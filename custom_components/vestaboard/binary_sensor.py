@@ -2,16 +2,23 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Mapping
+
 from homeassistant.components.binary_sensor import (
+    BinarySensorDeviceClass,
     BinarySensorEntity,
     BinarySensorEntityDescription,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_point_in_time
 from homeassistant.util.dt import now as dt_now
 
-from .coordinator import VestaboardConfigEntry
+from .circuit_breaker import BreakerState
+from .coordinator import VestaboardConfigEntry, VestaboardCoordinator
 from .entity import VestaboardEntity
 
 
@@ -21,21 +28,109 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Vestaboard binary sensors using config entry."""
-    async_add_entities([VestaboardBinarySensorEntity(entry, TEMPORARY_MESSAGE)])
+    async_add_entities(
+        VestaboardBinarySensorEntity(entry, description)
+        for description in BINARY_SENSORS
+    )
+
+
+def _temporary_message(coordinator: VestaboardCoordinator) -> bool:
+    """Return True if a temporary message is displayed."""
+    expiration = coordinator.temporary_message_expiration
+    return expiration is not None and expiration > dt_now()
+
 
+@dataclass(kw_only=True)
+class VestaboardBinarySensorEntityDescription(BinarySensorEntityDescription):
+    is_on_fn: Callable[[VestaboardCoordinator], bool]
+    always_available: bool = False
+    state_fn: Callable[[VestaboardCoordinator], Any] | None = None
+    expiration_fn: Callable[[VestaboardCoordinator], datetime | None] | None = None
 
-TEMPORARY_MESSAGE = BinarySensorEntityDescription(
-    key="temporary_message",
-    translation_key="temporary_message",
-    entity_category=EntityCategory.DIAGNOSTIC,
+
+BINARY_SENSORS = (
+    VestaboardBinarySensorEntityDescription(
+        key="temporary_message",
+        translation_key="temporary_message",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        is_on_fn=_temporary_message,
+        expiration_fn=lambda coor: coor.temporary_message_expiration,
+    ),
+    VestaboardBinarySensorEntityDescription(
+        key="circuit_breaker",
+        translation_key="circuit_breaker",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        is_on_fn=lambda coor: coor.breaker.state != BreakerState.CLOSED,
+        always_available=True,
+        state_fn=lambda coor: coor.breaker.state,
+    ),
 )
 
 
 class VestaboardBinarySensorEntity(VestaboardEntity, BinarySensorEntity):
     """Vestaboard binary sensor entity."""
 
+    entity_description: VestaboardBinarySensorEntityDescription
+    _unsub_expiration: CALLBACK_TYPE | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Start turning off when the displayed message expires."""
+        await super().async_added_to_hass()
+        self._async_track_expiration()
+        self.async_on_remove(self._async_cancel_expiration)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._async_track_expiration()
+        super()._handle_coordinator_update()
+
+    @callback
+    def _async_track_expiration(self) -> None:
+        """Schedule an update for the expiration, without waiting for a poll."""
+        self._async_cancel_expiration()
+        if (
+            (expiration_fn := self.entity_description.expiration_fn)
+            and (expiration := expiration_fn(self.coordinator))
+            and expiration > dt_now()
+        ):
+            self._unsub_expiration = async_track_point_in_time(
+                self.hass, self._async_handle_expiration, expiration
+            )
+
+    @callback
+    def _async_cancel_expiration(self) -> None:
+        """Cancel the scheduled expiration update."""
+        if self._unsub_expiration:
+            self._unsub_expiration()
+            self._unsub_expiration = None
+
+    @callback
+    def _async_handle_expiration(self, now: datetime) -> None:
+        """Turn off once the message expires."""
+        self._unsub_expiration = None
+        self._handle_coordinator_update()
+
+    def _state_dependency(self) -> Any:
+        """Return the coordinator state this entity's state is derived from."""
+        if state_fn := self.entity_description.state_fn:
+            return state_fn(self.coordinator)
+        return self.is_on
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return self.entity_description.always_available or super().available
+
     @property
     def is_on(self) -> bool:
         """Return true if the binary sensor is on."""
-        expiration = self.coordinator.temporary_message_expiration
-        return expiration is not None and expiration > dt_now()
+        return self.entity_description.is_on_fn(self.coordinator)
+
+    @property
+    def extra_state_attributes(self) -> Mapping[str, Any] | None:
+        """Return entity specific state attributes."""
+        if self.entity_description.key == "circuit_breaker":
+            return {"state": self.coordinator.breaker.state}
+        return None
@@ -0,0 +1,76 @@
+"""Circuit breaker for unreachable Vestaboards."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from enum import StrEnum
+import time
+
+
+class BreakerState(StrEnum):
+    """Circuit breaker state."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Track consecutive failures and short-circuit requests to a dead board.
+
+    After `failure_threshold` consecutive failures the breaker opens and
+    requests fail fast. Once `recovery_timeout` has passed it becomes half-open
+    and lets a single probe through; a success closes it again and a failure
+    re-opens it for another `recovery_timeout`.
+    """
+
+    def __init__(self, failure_threshold: int, recovery_timeout: timedelta) -> None:
+        """Initialize."""
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.failures = 0
+        self._opened_at: float | None = None
+        self._probe_started: float | None = None
+
+    @property
+    def state(self) -> BreakerState:
+        """Return the current state."""
+        if self._opened_at is None:
+            return BreakerState.CLOSED
+        if time.monotonic() - self._opened_at >= self.recovery_timeout.total_seconds():
+            return BreakerState.HALF_OPEN
+        return BreakerState.OPEN
+
+    def allow_request(self) -> bool:
+        """Return True if a request to the board should be attempted.
+
+        While half-open only one probe is let through at a time. A probe that
+        never reports back is given up on after another `recovery_timeout`.
+        """
+        state = self.state
+        if state == BreakerState.OPEN:
+            return False
+        if state == BreakerState.HALF_OPEN:
+            now = time.monotonic()
+            timeout = self.recovery_timeout.total_seconds()
+            if self._probe_started is not None and now - self._probe_started < timeout:
+                return False
+            self._probe_started = now
+        return True
+
+    def record_success(self) -> bool:
+        """Record a successful request, returning True if the breaker closed."""
+        was_open = self._opened_at is not None
+        self.failures = 0
+        self._opened_at = None
+        self._probe_started = None
+        return was_open
+
+    def record_failure(self) -> bool:
+        """Record a failed request, returning True if the breaker (re-)opened."""
+        self.failures += 1
+        self._probe_started = None
+        if self._opened_at is not None or self.failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+            return True
+        return False
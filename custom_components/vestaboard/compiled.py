@@ -0,0 +1,59 @@
+"""Compiled messages for the Vestaboard integration."""
+
+from __future__ import annotations
+
+import base64
+from collections import OrderedDict
+from dataclasses import dataclass
+import hashlib
+from typing import Any, Final
+
+from .helpers import decode
+
+MAX_COMPILED: Final = 64
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledMessage:
+    """A composed and rendered message, ready to send without either."""
+
+    handle: str
+    rows: list[list[int]]
+    model: str
+    image: bytes
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON serializable representation."""
+        return {
+            "handle": self.handle,
+            "model": self.model,
+            "rows": self.rows,
+            "message": decode(self.rows),
+            "image": base64.b64encode(self.image).decode(),
+        }
+
+
+def compiled_handle(payload_key: str, model: str) -> str:
+    """Return the handle of a message compiled for a model."""
+    return hashlib.sha256(f"{model}:{payload_key}".encode()).hexdigest()[:32]
+
+
+class CompiledMessages:
+    """The most recently compiled messages, by handle."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._compiled: OrderedDict[str, CompiledMessage] = OrderedDict()
+
+    def get(self, handle: str) -> CompiledMessage | None:
+        """Return a compiled message, if it is still cached."""
+        if compiled := self._compiled.get(handle):
+            self._compiled.move_to_end(handle)
+        return compiled
+
+    def add(self, compiled: CompiledMessage) -> None:
+        """Cache a compiled message, dropping the least recently used."""
+        self._compiled[compiled.handle] = compiled
+        self._compiled.move_to_end(compiled.handle)
+        if len(self._compiled) > MAX_COMPILED:
+            self._compiled.popitem(last=False)
@@ -6,31 +6,56 @@ import asyncio
 import logging
 from typing import Any
 
-from aiohttp import ClientConnectorError
-from httpx import ConnectError, HTTPStatusError
+from httpx import ConnectError, HTTPStatusError, TimeoutException
 import voluptuous as vol
 
 from homeassistant.components import dhcp
 from homeassistant.config_entries import ConfigEntry, ConfigFlow
-from homeassistant.const import CONF_API_KEY, CONF_HOST
+from homeassistant.const import CONF_API_KEY, CONF_HOST, CONF_NAME
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers.schema_config_entry_flow import (
+    SchemaCommonFlowHandler,
+    SchemaFlowError,
     SchemaFlowFormStep,
     SchemaOptionsFlowHandler,
 )
-from homeassistant.helpers.selector import TimeSelector
+from homeassistant.helpers.selector import (
+    NumberSelector,
+    NumberSelectorConfig,
+    NumberSelectorMode,
+    ObjectSelector,
+    SelectOptionDict,
+    SelectSelector,
+    SelectSelectorConfig,
+    TimeSelector,
+)
 
 from .const import (
+    CONF_ANIMATE_TRANSITIONS,
+    CONF_BOARDS,
+    CONF_COLUMNS,
+    CONF_COMPACT_ATTRIBUTES,
     CONF_ENABLEMENT_TOKEN,
+    CONF_FAILURE_THRESHOLD,
     CONF_MODEL,
+    CONF_QUEUE_OFFLINE_WRITES,
     CONF_QUIET_END,
+    CONF_QUIET_QUEUE,
+    CONF_QUIET_SCHEDULE,
     CONF_QUIET_START,
+    CONF_RECORD_CHARACTER_CODES,
+    CONF_RECORD_TRACE,
+    CONF_RECOVERY_TIMEOUT,
+    CONF_RENDER_PROCESS,
+    DEFAULT_FAILURE_THRESHOLD,
+    DEFAULT_RECOVERY_TIMEOUT,
     DOMAIN,
     MODEL_BLACK,
     MODEL_WHITE,
 )
-from .helpers import construct_message, create_client
+from .helpers import async_probe_client
+from .quiet_hours import QuietHoursSchedule
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -47,9 +72,51 @@ OPTIONS_SCHEMA = vol.Schema(
         ),
         vol.Optional(CONF_QUIET_START): TimeSelector(),
         vol.Optional(CONF_QUIET_END): TimeSelector(),
+        vol.Optional(CONF_QUIET_SCHEDULE): ObjectSelector(),
+        vol.Optional(CONF_QUIET_QUEUE, default=False): bool,
+        vol.Optional(CONF_RENDER_PROCESS, default=False): bool,
+        vol.Optional(CONF_ANIMATE_TRANSITIONS, default=False): bool,
+        vol.Optional(
+            CONF_FAILURE_THRESHOLD, default=DEFAULT_FAILURE_THRESHOLD
+        ): vol.All(
+            NumberSelector(
+                NumberSelectorConfig(min=1, max=20, mode=NumberSelectorMode.BOX)
+            ),
+            vol.Coerce(int),
+        ),
+        vol.Optional(CONF_RECOVERY_TIMEOUT, default=DEFAULT_RECOVERY_TIMEOUT): vol.All(
+            NumberSelector(
+                NumberSelectorConfig(
+                    min=30,
+                    max=3600,
+                    mode=NumberSelectorMode.BOX,
+                    unit_of_measurement="seconds",
+                )
+            ),
+            vol.Coerce(int),
+        ),
+        vol.Optional(CONF_QUEUE_OFFLINE_WRITES, default=False): bool,
+        vol.Optional(CONF_COMPACT_ATTRIBUTES, default=False): bool,
+        vol.Optional(CONF_RECORD_CHARACTER_CODES, default=True): bool,
+        vol.Optional(CONF_RECORD_TRACE, default=False): bool,
     }
 )
-OPTIONS_FLOW = {"init": SchemaFlowFormStep(OPTIONS_SCHEMA)}
+
+
+async def validate_options(
+    handler: SchemaCommonFlowHandler, user_input: dict[str, Any]
+) -> dict[str, Any]:
+    """Validate the quiet hours schedule."""
+    try:
+        QuietHoursSchedule.from_config(user_input.get(CONF_QUIET_SCHEDULE))
+    except (AttributeError, TypeError, ValueError) as err:
+        raise SchemaFlowError("invalid_quiet_schedule") from err
+    return user_input
+
+
+OPTIONS_FLOW = {
+    "init": SchemaFlowFormStep(OPTIONS_SCHEMA, validate_user_input=validate_options)
+}
 
 
 class VestaboardConfigFlow(ConfigFlow, domain=DOMAIN):
@@ -61,6 +128,16 @@ class VestaboardConfigFlow(ConfigFlow, domain=DOMAIN):
     api_key: str | None = None
     name: str | None = None
 
+    def __init__(self) -> None:
+        """Initialize the flow."""
+        self._probes: dict[tuple[str, str, bool], asyncio.Task[str | None]] = {}
+
+    @classmethod
+    @callback
+    def async_supports_options_flow(cls, config_entry: ConfigEntry) -> bool:
+        """Return options flow support, which walls don't have."""
+        return CONF_BOARDS not in config_entry.data
+
     @staticmethod
     @callback
     def async_get_options_flow(config_entry: ConfigEntry) -> SchemaOptionsFlowHandler:
@@ -79,8 +156,63 @@ class VestaboardConfigFlow(ConfigFlow, domain=DOMAIN):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Handle the initial step."""
+        if user_input is None and len(self._async_boards()) >= 2:
+            return self.async_show_menu(step_id="user", menu_options=["board", "wall"])
         return await self._async_step("user", STEP_USER_DATA_SCHEMA, user_input)
 
+    async def async_step_board(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle adding a single board."""
+        return await self._async_step("user", STEP_USER_DATA_SCHEMA)
+
+    async def async_step_wall(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle combining boards into a wall."""
+        errors = {}
+        if user_input is not None:
+            boards = user_input[CONF_BOARDS]
+            if len(boards) < 2 or len(boards) % user_input[CONF_COLUMNS]:
+                errors["base"] = "invalid_wall_layout"
+            else:
+                return self.async_create_entry(
+                    title=user_input[CONF_NAME],
+                    data={CONF_BOARDS: boards, CONF_COLUMNS: user_input[CONF_COLUMNS]},
+                )
+
+        schema = vol.Schema(
+            {
+                vol.Required(CONF_NAME, default="Vestaboard wall"): str,
+                vol.Required(CONF_BOARDS): SelectSelector(
+                    SelectSelectorConfig(
+                        options=[
+                            SelectOptionDict(value=entry.entry_id, label=entry.title)
+                            for entry in self._async_boards()
+                        ],
+                        multiple=True,
+                    )
+                ),
+                vol.Required(CONF_COLUMNS, default=2): vol.All(
+                    NumberSelector(
+                        NumberSelectorConfig(min=1, max=10, mode=NumberSelectorMode.BOX)
+                    ),
+                    vol.Coerce(int),
+                ),
+            }
+        )
+        schema = self.add_suggested_values_to_schema(schema, user_input)
+        return self.async_show_form(step_id="wall", data_schema=schema, errors=errors)
+
+    @callback
+    def _async_boards(self) -> list[ConfigEntry]:
+        """Return the configured boards, excluding walls."""
+        return [
+            entry
+            for entry in self._async_current_entries()
+            if CONF_BOARDS not in entry.data
+        ]
+
     async def async_step_api_key(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -137,65 +269,63 @@ class VestaboardConfigFlow(ConfigFlow, domain=DOMAIN):
         )
         return self.async_show_form(step_id=step_id, data_schema=schema, errors=errors)
 
-    async def validate_client(
-        self, user_input: dict[str, Any], write: bool = True
-    ) -> dict[str, str]:
-        """Validate client setup."""
+    async def validate_client(self, user_input: dict[str, Any]) -> dict[str, str]:
+        """Validate client setup.
+
+        Probes are cached for the life of the flow, so validating the same host
+        and key again, e.g. when checking for existing entries, is free.
+        """
+        data = {CONF_HOST: self.host} | user_input
+        key = (
+            data[CONF_HOST],
+            data[CONF_API_KEY],
+            bool(data.get(CONF_ENABLEMENT_TOKEN)),
+        )
+        if (probe := self._probes.get(key)) is None:
+            probe = self._probes[key] = self.hass.async_create_task(
+                async_probe_client(self.hass, data)
+            )
         errors = {}
         try:
-            client = await self.hass.async_add_executor_job(
-                create_client, {"host": self.host} | user_input
-            )
-            if not client.read_message():
+            if not (api_key := await probe):
                 errors["base"] = "invalid_api_key"
             else:
-                if write:
-                    client.write_message(
-                        construct_message(
-                            "\n".join(
-                                [
-                                    "{63}{63}{63}{63}{63}{63}{64}{64}{64}{64}{64}{64}{64}{64}{64}{65}{65}{65}{65}{65}{65}{65}",
-                                    "{63}{0}{0}{0}{0}{0}{0}{0}{0}{0}{0}{0}{0}{0}{0}{0}{0}{0}{0}{0}{0}{65}",
-                                    "{63}{0} Now connected to {0}{65}",
-                                    "{68}{0}{0} Home Assistant {0}{0}{66}",
-                                    "{68}{0}{0}{0}{0}{0}{0}{0}{0}{0}{0}{0}{0}{0}{0}{0}{0}{0}{0}{0}{0}{66}",
-                                    "{68}{68}{68}{68}{68}{68}{68}{67}{67}{67}{67}{67}{67}{67}{67}{67}{66}{66}{66}{66}{66}{66}",
-                                ]
-                            )
-                        )
-                    )
-                self.api_key = client.api_key
-        except asyncio.TimeoutError:
+                self.api_key = api_key
+        except TimeoutException:
             errors["base"] = "timeout_connect"
         except ConnectError:
             errors["base"] = "invalid_host"
-        except ClientConnectorError:
-            errors["base"] = "unknown"
         except HTTPStatusError as err:
             errors["base"] = str(err)
         except Exception as ex:  # pylint: disable=broad-except
             _LOGGER.error(ex)
             errors["base"] = "unknown"
+        if errors:
+            # Only cache successful probes so the user can retry
+            self._probes.pop(key, None)
         return errors
 
     async def _abort_if_configured(
         self, user_input: dict[str, Any] | None
     ) -> FlowResult | None:
         """Abort if configured."""
-        if self.host or user_input:
-            data = {CONF_HOST: self.host, **(user_input or {})}
-            for entry in self._async_current_entries():
+        if user_input:
+            data = {CONF_HOST: self.host, **user_input}
+            for entry in self._async_boards():
                 if entry.data[CONF_HOST] == data[CONF_HOST] or entry.data[
                     CONF_API_KEY
                 ] == data.get(CONF_API_KEY):
-                    if not await self.validate_client(user_input, write=False):
-                        return self.async_update_reload_and_abort(
-                            entry,
-                            unique_id=self.unique_id or entry.unique_id,
-                            data_updates={
-                                CONF_HOST: user_input.get(CONF_HOST, self.host),
-                                CONF_API_KEY: self.api_key,
-                            },
-                            reason="already_configured",
-                        )
+                    # Every candidate is checked with the same input, so one
+                    # probe decides whether the first match is updated
+                    if await self.validate_client(user_input):
+                        return None
+                    return self.async_update_reload_and_abort(
+                        entry,
+                        unique_id=self.unique_id or entry.unique_id,
+                        data_updates={
+                            CONF_HOST: user_input.get(CONF_HOST, self.host),
+                            CONF_API_KEY: self.api_key,
+                        },
+                        reason="already_configured",
+                    )
         return None
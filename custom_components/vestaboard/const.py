@@ -15,19 +15,67 @@ ALIGN_HORIZONTAL: Final = [ALIGN_LEFT, ALIGN_RIGHT, ALIGN_CENTER, ALIGN_JUSTIFIE
 ALIGN_VERTICAL: Final = [ALIGN_TOP, ALIGN_BOTTOM, ALIGN_CENTER, ALIGN_JUSTIFIED]
 
 CONF_ALIGN: Final = "align"
+CONF_ANIMATE_TRANSITIONS: Final = "animate_transitions"
+CONF_BOARDS: Final = "boards"
+CONF_CAMERA: Final = "camera"
+CONF_COMPACT_ATTRIBUTES: Final = "compact_attributes"
+CONF_COLUMNS: Final = "columns"
+CONF_DITHER: Final = "dither"
 CONF_DURATION: Final = "duration"
+CONF_DWELL: Final = "dwell"
 CONF_ENABLEMENT_TOKEN: Final = "enablement_token"
+CONF_FAILURE_THRESHOLD: Final = "failure_threshold"
+CONF_HANDLE: Final = "handle"
+CONF_HEIGHT: Final = "height"
+CONF_INTERVAL: Final = "interval"
+CONF_ITEMS: Final = "items"
 CONF_JUSTIFY: Final = "justify"
+CONF_LOOKAHEAD: Final = "lookahead"
+CONF_MEDIA_PLAYER: Final = "media_player"
 CONF_MESSAGE: Final = "message"
+CONF_MESSAGE_ID: Final = "message_id"
 CONF_MODEL: Final = "model"
+CONF_PRIORITY: Final = "priority"
+CONF_PROPS: Final = "props"
+CONF_QUEUE_OFFLINE_WRITES: Final = "queue_offline_writes"
 CONF_QUIET_END: Final = "quiet_end"
+CONF_QUIET_QUEUE: Final = "quiet_queue"
+CONF_QUIET_SCHEDULE: Final = "quiet_schedule"
 CONF_QUIET_START: Final = "quiet_start"
+CONF_RECORD_CHARACTER_CODES: Final = "record_character_codes"
+CONF_RECORD_TRACE: Final = "record_trace"
+CONF_RECOVERY_TIMEOUT: Final = "recovery_timeout"
+CONF_RENDER_PROCESS: Final = "render_process"
+CONF_ROWS: Final = "rows"
 CONF_VBML: Final = "vbml"
 
+DEFAULT_FAILURE_THRESHOLD: Final = 3
+DEFAULT_RECOVERY_TIMEOUT: Final = 300
+
+CHANGE_SOURCE_POLL: Final = "poll"
+CHANGE_SOURCE_WRITE: Final = "write"
+
+EVENT_BOARD_CHANGED: Final = "vestaboard_board_changed"
+
+DATA_COMPILED: Final = "compiled"
 DATA_HASS_CONFIG: Final = "hass_config"
+DATA_RENDERER: Final = "renderer"
+DATA_TILE_ART: Final = "tile_art"
 
 MODEL_BLACK: Final = "black"
 MODEL_WHITE: Final = "white"
 
+SERVICE_CANCEL_MESSAGE: Final = "cancel_message"
+SERVICE_CANCEL_TEMPLATE: Final = "cancel_template"
+SERVICE_COMPILE: Final = "compile"
+SERVICE_DELETE_PLAYLIST: Final = "delete_playlist"
+SERVICE_LIST_MESSAGES: Final = "list_messages"
 SERVICE_MESSAGE: Final = "message"
+SERVICE_MESSAGE_BATCH: Final = "message_batch"
+SERVICE_RENDER: Final = "render"
+SERVICE_SCHEDULE_TEMPLATE: Final = "schedule_template"
+SERVICE_SET_PLAYLIST: Final = "set_playlist"
+SERVICE_SHOW_IMAGE: Final = "show_image"
+SERVICE_START_PLAYLIST: Final = "start_playlist"
+SERVICE_STOP_PLAYLIST: Final = "stop_playlist"
 VBML_URL: Final = "https://vbml.vestaboard.com/compose"
@@ -2,26 +2,96 @@
 
 from __future__ import annotations
 
+import asyncio
+import base64
 from datetime import datetime, timedelta
 import logging
+import time
+from typing import TYPE_CHECKING, Any, TypedDict
 
 import async_timeout
+import httpx
 from vesta import LocalClient
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import CALLBACK_TYPE, HomeAssistant
-from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed, HomeAssistantError
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 import homeassistant.util.dt as dt_util
 
-from .const import CONF_MODEL, CONF_QUIET_END, CONF_QUIET_START, DOMAIN, MODEL_BLACK
-from .helpers import create_png, decode
+from .circuit_breaker import BreakerState, CircuitBreaker
+from .const import (
+    CHANGE_SOURCE_POLL,
+    CHANGE_SOURCE_WRITE,
+    CONF_ANIMATE_TRANSITIONS,
+    CONF_COMPACT_ATTRIBUTES,
+    CONF_FAILURE_THRESHOLD,
+    CONF_MODEL,
+    CONF_QUEUE_OFFLINE_WRITES,
+    CONF_QUIET_END,
+    CONF_QUIET_QUEUE,
+    CONF_QUIET_SCHEDULE,
+    CONF_QUIET_START,
+    CONF_RECORD_TRACE,
+    CONF_RECOVERY_TIMEOUT,
+    CONF_RENDER_PROCESS,
+    DATA_RENDERER,
+    DEFAULT_FAILURE_THRESHOLD,
+    DEFAULT_RECOVERY_TIMEOUT,
+    DOMAIN,
+    EVENT_BOARD_CHANGED,
+    MODEL_BLACK,
+)
+from .helpers import decode, diff_grid, same_shape
+from .playlist import PlaylistManager
+from .quiet_hours import QuietHoursSchedule
+from .render import DEFAULT_HEIGHT, VestaboardRenderer, snap_height
+from .scheduler import MessageScheduler, ScheduledMessage, StoredMessage
+from .trace import (
+    TRACE_CANCEL,
+    TRACE_CLEAR,
+    TRACE_PERSISTENT,
+    TRACE_READ,
+    TRACE_TEMPORARY,
+    TRACE_WRITE,
+    TraceRecorder,
+    encode_grid,
+    get_trace_path,
+)
+
+if TYPE_CHECKING:
+    from .scheduled_template import ScheduledTemplate
 
 _LOGGER = logging.getLogger(__name__)
 
+UPDATE_INTERVAL = timedelta(seconds=15)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 10
+
 type VestaboardConfigEntry = ConfigEntry[VestaboardCoordinator]
 
 
+class StoredState(TypedDict):
+    """Stored state of a board."""
+
+    model: str
+    data: list[list[int]]
+    persistent_message: list[list[int]] | None
+    last_updated: str | None
+    image: str | None
+    temporary_messages: list[StoredMessage]
+    displayed: str | None
+
+
+def async_get_state_store(hass: HomeAssistant, entry_id: str) -> Store[StoredState]:
+    """Return the store holding the last known state of a board."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.state")
+
+
 class VestaboardCoordinator(DataUpdateCoordinator):
     """Vestaboard data update coordinator."""
 
@@ -32,8 +102,15 @@ class VestaboardCoordinator(DataUpdateCoordinator):
     message: str | None
     image: bytes | None
     persistent_message: list[list[int]] | None = None
-    temporary_message_expiration: datetime | None = None
-    _cancel_cb: CALLBACK_TYPE | None = None
+    scheduled_template: ScheduledTemplate | None = None
+    transition: bytes | None = None
+    transition_updated: datetime | None = None
+    _device_id: str | None = None
+    _displayed: ScheduledMessage | None = None
+    _image_variants: tuple[list[list[int]], asyncio.Task[dict[int, bytes]]] | None = (
+        None
+    )
+    _queued_write: list[list[int]] | None = None
 
     _read_errors: int = 0
 
@@ -49,72 +126,456 @@ class VestaboardCoordinator(DataUpdateCoordinator):
             _LOGGER,
             config_entry=config_entry,
             name=DOMAIN,
-            update_interval=timedelta(seconds=15),
+            update_interval=UPDATE_INTERVAL,
+            # Polls mostly return what is already displayed
+            always_update=False,
         )
         self.vestaboard = vestaboard
+        options = config_entry.options
+        self.breaker = CircuitBreaker(
+            options.get(CONF_FAILURE_THRESHOLD, DEFAULT_FAILURE_THRESHOLD),
+            timedelta(
+                seconds=options.get(CONF_RECOVERY_TIMEOUT, DEFAULT_RECOVERY_TIMEOUT)
+            ),
+        )
+        self.queue_offline_writes = options.get(CONF_QUEUE_OFFLINE_WRITES, False)
+        self.renderer: VestaboardRenderer = hass.data[DOMAIN][DATA_RENDERER]
+        self.scheduler = MessageScheduler(hass, self._async_handle_expiration)
+        self.playlists = PlaylistManager(self)
+        self._store = async_get_state_store(hass, config_entry.entry_id)
+        self.trace = (
+            TraceRecorder(hass, get_trace_path(hass, config_entry.entry_id))
+            if options.get(CONF_RECORD_TRACE, False)
+            else None
+        )
 
         self.model = config_entry.options.get(CONF_MODEL, MODEL_BLACK)
-        if (start := config_entry.options.get(CONF_QUIET_START)) != (
-            end := config_entry.options.get(CONF_QUIET_END)
-        ):
-            self.quiet_start = dt_util.parse_time(start)
-            self.quiet_end = dt_util.parse_time(end)
-        else:
-            self.quiet_start = self.quiet_end = None
+        self.render_process = config_entry.options.get(CONF_RENDER_PROCESS, False)
+        self.compact_attributes = options.get(CONF_COMPACT_ATTRIBUTES, False)
+        self.animate_transitions = options.get(CONF_ANIMATE_TRANSITIONS, False)
+        self.quiet_schedule = QuietHoursSchedule.from_config(
+            options.get(CONF_QUIET_SCHEDULE),
+            options.get(CONF_QUIET_START),
+            options.get(CONF_QUIET_END),
+        )
+        self.quiet_queue = options.get(CONF_QUIET_QUEUE, False)
+        self._quiet = False
+        self._quiet_pending = False
+        self._unsub_quiet: CALLBACK_TYPE | None = None
+
+    @property
+    def host(self) -> str:
+        """Return the host of the Vestaboard."""
+        return self.vestaboard.http.base_url.host
 
-    def process_data(self, data: list[list[int]]) -> list[list[int]]:
-        """Process data."""
+    async def async_process_data(
+        self,
+        data: list[list[int]],
+        image: bytes | None = None,
+        source: str = CHANGE_SOURCE_WRITE,
+    ) -> list[list[int]]:
+        """Process data, using a pre-rendered image if provided."""
         if data != self.data:
             self.last_updated = dt_util.now()
             self.message = decode(data)
-            self.image = create_png(data, self.model)
+            self.image = image or await self.renderer.async_render_png(
+                data, self.model, use_process=self.render_process
+            )
+            if self.data is not None:
+                self._async_fire_board_changed(data, source)
+                if self.animate_transitions and same_shape(self.data, data):
+                    self.config_entry.async_create_background_task(
+                        self.hass,
+                        self._async_render_transition(self.data, data),
+                        "vestaboard transition",
+                    )
+            self._async_save_state()
         return data
 
+    async def async_restore_state(self) -> bool:
+        """Restore the last known state, returning True if there was one.
+
+        Restoring lets entities show the last grid and image right away, while
+        the first read of the board happens in the background.
+        """
+        if not (stored := await self._store.async_load()):
+            return False
+        data = stored["data"]
+        self.persistent_message = stored["persistent_message"]
+        if last_updated := stored["last_updated"]:
+            self.last_updated = dt_util.parse_datetime(last_updated)
+        self.message = decode(data)
+        if (image := stored["image"]) and stored["model"] == self.model:
+            self.image = base64.b64decode(image)
+        else:
+            self.image = await self.renderer.async_render_png(
+                data, self.model, use_process=self.render_process
+            )
+        self.scheduler.async_restore(stored["temporary_messages"])
+        current = self.scheduler.current
+        if current and current.id == stored["displayed"]:
+            self._displayed = current
+        self.data = data
+        if current is not self._displayed:
+            # Messages expired while stopped, so show what is due once running
+            self.config_entry.async_create_background_task(
+                self.hass,
+                self._async_handle_expiration(),
+                "vestaboard restored display",
+            )
+        return True
+
+    @callback
+    def _async_save_state(self) -> None:
+        """Save the state to restore on the next start."""
+        self._store.async_delay_save(self._state_to_save, SAVE_DELAY)
+
+    @callback
+    def _state_to_save(self) -> dict[str, Any]:
+        """Return the state to save."""
+        return {
+            "model": self.model,
+            "data": self.data,
+            "persistent_message": self.persistent_message,
+            "last_updated": self.last_updated.isoformat()
+            if self.last_updated
+            else None,
+            "image": base64.b64encode(self.image).decode() if self.image else None,
+            "temporary_messages": self.scheduler.as_stored(),
+            "displayed": self._displayed.id if self._displayed else None,
+        }
+
+    async def _async_render_transition(
+        self, old: list[list[int]], new: list[list[int]]
+    ) -> None:
+        """Render the board flipping to a new grid."""
+        transition = await self.renderer.async_render_transition(
+            old, new, self.model, use_process=self.render_process
+        )
+        # A later change may have finished first
+        if new == self.data:
+            self.transition = transition
+            self.transition_updated = dt_util.now()
+            self.async_update_listeners()
+
+    @callback
+    def _async_fire_board_changed(self, data: list[list[int]], source: str) -> None:
+        """Fire an event with the cells that changed.
+
+        A grid of another shape, such as after the model changes, is sent whole.
+        """
+        if self._device_id is None and (
+            device := dr.async_get(self.hass).async_get_device(
+                identifiers={(DOMAIN, self.config_entry.entry_id)}
+            )
+        ):
+            self._device_id = device.id
+        if same_shape(self.data, data):
+            change: dict[str, Any] = {"cells": diff_grid(self.data, data)}
+        else:
+            change = {"grid": data}
+        self.hass.bus.async_fire(
+            EVENT_BOARD_CHANGED,
+            {"device_id": self._device_id, **change, "source": source},
+        )
+
+    async def async_get_image(self, height: int) -> bytes | None:
+        """Return the image at the smallest pre-generated height covering a height.
+
+        Every height is rendered together on the first request for a grid and
+        dropped together when the grid changes.
+        """
+        if self.data is None:
+            return None
+        if (height := snap_height(height)) == DEFAULT_HEIGHT and self.image:
+            return self.image
+        if self._image_variants is None or self._image_variants[0] != self.data:
+            # Shared so concurrent requests only render once
+            task = self.hass.async_create_task(
+                self.renderer.async_render_png_variants(
+                    self.data, self.model, use_process=self.render_process
+                )
+            )
+            self._image_variants = (self.data, task)
+        return (await self._image_variants[1])[height]
+
     def quiet_hours(self) -> bool:
         """Check if quiet hours."""
-        if self.quiet_start and self.quiet_end:
-            now = dt_util.now().time()
-            if self.quiet_start < self.quiet_end:
-                return self.quiet_start <= now < self.quiet_end
-            return self.quiet_start <= now or now < self.quiet_end
-        return False
+        return self._quiet
+
+    @callback
+    def async_setup_quiet_hours(self, now: datetime | None = None) -> None:
+        """Start tracking quiet hours transitions."""
+        if self.quiet_schedule is None:
+            return
+        now = now or dt_util.now()
+        self._quiet = self.quiet_schedule.is_quiet(now)
+        self._update_polling()
+        # Re-check weekly when no window is coming up, e.g. only far off dates
+        when = self.quiet_schedule.next_transition(now) or now + timedelta(days=7)
+        self._unsub_quiet = async_track_point_in_time(
+            self.hass, self._async_handle_quiet_transition, when
+        )
+
+    async def _async_handle_quiet_transition(self, now: datetime) -> None:
+        """Handle quiet hours starting or ending."""
+        was_quiet = self._quiet
+        self.async_setup_quiet_hours(now)
+        if was_quiet == self._quiet:
+            return
+        _LOGGER.debug(
+            "Vestaboard quiet hours %s", "started" if self._quiet else "ended"
+        )
+        if self._quiet:
+            return
+        if self._quiet_pending:
+            self._quiet_pending = False
+            try:
+                # A single write of whatever should be displayed now
+                await self._async_display_changed(force=True)
+            except HomeAssistantError as err:
+                _LOGGER.warning("Unable to write messages queued overnight: %s", err)
+        await self.async_request_refresh()
+
+    def _update_polling(self) -> None:
+        """Suspend polling while quiet and poll less while unreachable."""
+        if self._quiet:
+            self.update_interval = None
+        elif self.breaker.state == BreakerState.CLOSED:
+            self.update_interval = UPDATE_INTERVAL
+        else:
+            self.update_interval = self.breaker.recovery_timeout
+
+    def _record_failure(self) -> None:
+        """Record a failed request to the board."""
+        if self.breaker.record_failure():
+            _LOGGER.debug(
+                "Vestaboard at %s is unreachable, pausing requests for %s",
+                self.host,
+                self.breaker.recovery_timeout,
+            )
+            self._update_polling()
+            self.async_update_listeners()
+
+    def _record_success(self) -> bool:
+        """Record a successful request to the board, returning True on recovery."""
+        if recovered := self.breaker.record_success():
+            self._update_polling()
+            self.async_update_listeners()
+        return recovered
 
     async def _async_update_data(self):
         """Fetch data from Vestaboard."""
+        if self._quiet and self.data is not None:
+            return self.data
+        if not self.breaker.allow_request():
+            raise UpdateFailed(f"Vestaboard at {self.host} is unreachable")
+        start = time.monotonic()
         try:
             async with async_timeout.timeout(10):
                 data = await self.hass.async_add_executor_job(
                     self.vestaboard.read_message
                 )
         except Exception as ex:
-            raise UpdateFailed(
-                f"Couldn't read vestaboard at {self.vestaboard.http.base_url.host}"
-            ) from ex
+            self._record_failure()
+            self._async_trace(
+                TRACE_READ,
+                error=type(ex).__name__,
+                seconds=round(time.monotonic() - start, 3),
+            )
+            raise UpdateFailed(f"Couldn't read vestaboard at {self.host}") from ex
+        self._async_trace(
+            TRACE_READ,
+            grid=encode_grid(data),
+            seconds=round(time.monotonic() - start, 3),
+        )
+        # The board answered, even if it rejected the key
+        recovered = self._record_success()
         if data is None:
             raise ConfigEntryAuthFailed
 
+        source = CHANGE_SOURCE_POLL
+        if recovered and (rows := self._queued_write):
+            _LOGGER.debug("Vestaboard at %s reconnected, replaying message", self.host)
+            try:
+                await self._async_write(rows)
+            except HomeAssistantError as err:
+                # Kept queued for the next reconnect
+                raise UpdateFailed(str(err)) from err
+            if self._queued_write is rows:
+                self._queued_write = None
+            data, source = rows, CHANGE_SOURCE_WRITE
+
         if self.persistent_message is None:
             self.persistent_message = data
 
-        return await self.hass.async_add_executor_job(self.process_data, data)
+        return await self.async_process_data(data, source=source)
+
+    async def _async_write(self, message_rows: list[list[int]]) -> None:
+        """Write to the board, tracking connection failures."""
+        start = time.monotonic()
+        try:
+            await self.hass.async_add_executor_job(
+                self.vestaboard.write_message, message_rows
+            )
+        except httpx.HTTPError as ex:
+            self._record_failure()
+            raise HomeAssistantError(
+                f"Couldn't write to vestaboard at {self.host}"
+            ) from ex
+        finally:
+            self._async_trace(
+                TRACE_WRITE,
+                grid=encode_grid(message_rows),
+                seconds=round(time.monotonic() - start, 3),
+            )
+        self._record_success()
+
+    @callback
+    def _async_trace(self, kind: str, **payload: Any) -> None:
+        """Record board traffic when tracing is enabled."""
+        if self.trace:
+            self.trace.async_record(kind, **payload)
 
-    async def write_and_update_state(self, message_rows: list[list[int]]) -> None:
+    async def write_and_update_state(
+        self, message_rows: list[list[int]], image: bytes | None = None
+    ) -> None:
         """Write to board and immediately update coordinator."""
-        await self.hass.async_add_executor_job(
-            self.vestaboard.write_message, message_rows
-        )
+        if not self.breaker.allow_request():
+            if self.queue_offline_writes:
+                self._queued_write = message_rows
+                return
+            raise HomeAssistantError(f"Vestaboard at {self.host} is unreachable")
+        await self._async_write(message_rows)
         # Manually update coordinator state for instant UI feedback
-        self.async_set_updated_data(self.process_data(message_rows))
+        self.async_set_updated_data(await self.async_process_data(message_rows, image))
 
-    async def _handle_temporary_message_expiration(self, now: datetime) -> None:
-        """Handle temporary message expiration."""
-        _LOGGER.debug(
-            "Vestaboard temporary message expired @ %s, reverting to persistent message",
-            now,
+    @property
+    def temporary_message_expiration(self) -> datetime | None:
+        """Return the expiration of the displayed temporary message."""
+        return entry.expiration if (entry := self.scheduler.current) else None
+
+    async def async_show_temporary_message(
+        self,
+        rows: list[list[int]],
+        duration: timedelta,
+        priority: int = 0,
+        image: bytes | None = None,
+    ) -> ScheduledMessage | None:
+        """Queue a temporary message, showing it if it has the highest priority.
+
+        During quiet hours the message is dropped unless quiet hours queuing is
+        enabled.
+        """
+        if self._quiet and not self.quiet_queue:
+            return None
+        entry = self.scheduler.async_add(rows, duration, priority)
+        self._async_trace(
+            TRACE_TEMPORARY,
+            grid=encode_grid(rows),
+            duration=duration.total_seconds(),
+            priority=priority,
+            id=entry.id,
+        )
+        # The pre-rendered image only applies if this message is the one shown
+        await self._async_display_changed(
+            image=image if self.scheduler.current is entry else None
         )
-        self.temporary_message_expiration = None
-        if rows := self.persistent_message:
-            await self.write_and_update_state(rows)
-        if self._cancel_cb:
-            self._cancel_cb()
-            self._cancel_cb = None
+        return entry
+
+    async def async_set_persistent_message(
+        self,
+        rows: list[list[int]],
+        image: bytes | None = None,
+        *,
+        skip_if_displayed: bool = False,
+    ) -> None:
+        """Set the persistent message, showing it if no temporary message is.
+
+        During quiet hours the message is dropped unless quiet hours queuing is
+        enabled. With `skip_if_displayed`, the write is skipped if the board
+        still shows the message when read.
+        """
+        self._async_trace(TRACE_PERSISTENT, grid=encode_grid(rows))
+        if self._quiet:
+            if self.quiet_queue:
+                self.persistent_message = rows
+                self._quiet_pending = True
+                self._async_save_state()
+            return
+        self.persistent_message = rows
+        self._async_save_state()
+        if self.scheduler.current is None:
+            if skip_if_displayed and await self._async_is_displayed(rows):
+                return
+            await self.write_and_update_state(rows, image)
+
+    async def _async_is_displayed(self, rows: list[list[int]]) -> bool:
+        """Return True if the board shows a grid with no write queued over it.
+
+        The last poll may be out of date, so the board is read again first.
+        """
+        if self._queued_write is not None or self.data != rows:
+            return False
+        await self.async_refresh()
+        return self.last_update_success and self.data == rows
+
+    async def async_cancel_temporary_message(self, message_id: str) -> bool:
+        """Cancel a temporary message."""
+        self._async_trace(TRACE_CANCEL, id=message_id)
+        if cancelled := self.scheduler.async_cancel(message_id):
+            await self._async_display_changed()
+        return cancelled
+
+    async def async_clear_temporary_messages(self) -> None:
+        """Cancel all temporary messages and revert to the persistent message."""
+        self._async_trace(TRACE_CLEAR)
+        self.scheduler.async_clear()
+        await self._async_display_changed()
+
+    async def _async_display_changed(
+        self, force: bool = False, image: bytes | None = None
+    ) -> None:
+        """Write the message that should be displayed, if it changed."""
+        self._async_save_state()
+        entry = self.scheduler.current
+        if entry is self._displayed and not force:
+            self.async_update_listeners()
+            return
+        if self._quiet:
+            # Written as one update when quiet hours end
+            self._quiet_pending = True
+            self.async_update_listeners()
+            return
+        previous, self._displayed = self._displayed, entry
+        if rows := entry.rows if entry else self.persistent_message:
+            try:
+                await self.write_and_update_state(rows, image)
+            except HomeAssistantError:
+                # Not shown, so the next change writes it again
+                if self._displayed is entry:
+                    self._displayed = previous
+                raise
+        else:
+            self.async_update_listeners()
+
+    async def _async_handle_expiration(self) -> None:
+        """Handle temporary message expiration."""
+        _LOGGER.debug("Vestaboard temporary message expired")
+        try:
+            await self._async_display_changed()
+        except HomeAssistantError as err:
+            _LOGGER.warning("Unable to update expired temporary message: %s", err)
+
+    async def async_shutdown(self) -> None:
+        """Cancel pending timers."""
+        self.scheduler.async_stop()
+        self.playlists.async_unload()
+        if self._unsub_quiet:
+            self._unsub_quiet()
+            self._unsub_quiet = None
+        if self.scheduled_template:
+            self.scheduled_template.async_remove(self)
+        if self.trace:
+            await self.trace.async_stop()
+        await super().async_shutdown()
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import logging
+from typing import Any
 
+from homeassistant.core import callback
 from homeassistant.helpers.entity import DeviceInfo, EntityDescription
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -17,6 +19,7 @@ class VestaboardEntity(CoordinatorEntity[VestaboardCoordinator]):
     """Base class for Vestaboard entities."""
 
     _attr_has_entity_name = True
+    _written_state: tuple[bool, Any] | None = None
 
     def __init__(
         self,
@@ -34,3 +37,16 @@ class VestaboardEntity(CoordinatorEntity[VestaboardCoordinator]):
             manufacturer="Vestaboard",
             model="Vestaboard",
         )
+
+    def _state_dependency(self) -> Any:
+        """Return the coordinator state this entity's state is derived from."""
+        return None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only if something it depends on changed."""
+        state = (self.available, self._state_dependency())
+        if state == self._written_state:
+            return
+        self._written_state = state
+        super()._handle_coordinator_update()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from importlib import resources
 import io
 from typing import Final
@@ -11,6 +12,7 @@ from PIL import ImageFont
 FONT_NAME: Final = "Vestaboard.otf"
 
 
+@lru_cache(maxsize=1)
 def _load_font_bytes() -> bytes:
     """Load the raw font bytes from the font file."""
     return resources.read_binary(__package__, FONT_NAME)
@@ -26,6 +28,7 @@ def get_font_bytes() -> bytes:
     return _load_font_bytes()
 
 
+@lru_cache(maxsize=32)
 def load_font(size: float | None) -> ImageFont:
     """Load a font."""
     try:
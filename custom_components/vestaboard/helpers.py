@@ -3,32 +3,50 @@
 from __future__ import annotations
 
 import base64
+from collections.abc import Iterable
 import io
 from typing import TYPE_CHECKING, Any, cast
 
 import httpx
-from PIL import Image, ImageDraw
-from vesta import Color, LocalClient, encode_text
+from PIL import Image, ImageDraw, ImageFont
+from vesta import LocalClient, encode, encode_text
 
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_API_KEY, CONF_HOST
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.httpx_client import get_async_client
 from homeassistant.util.ssl import get_default_context
 
 from .const import (
+    ALIGN_BOTTOM,
     ALIGN_CENTER,
     ALIGN_JUSTIFIED,
+    ALIGN_LEFT,
+    ALIGN_RIGHT,
+    ALIGN_TOP,
     CONF_ALIGN,
+    CONF_BOARDS,
     CONF_ENABLEMENT_TOKEN,
     CONF_JUSTIFY,
     DOMAIN,
     MODEL_BLACK,
 )
 from .fontloader import get_font_bytes, load_font
+from .layout import FLAP_RATIO, BoardLayout, Tile, get_layout, hex_color
 from .vestaboard_model import VestaboardModel
 
 if TYPE_CHECKING:
     from .coordinator import VestaboardCoordinator
 
+PROBE_TIMEOUT = 5
+SVG_HEIGHT = 177
+
+FLIP_CODES = 72
+TRANSITION_FRAMES = 20
+TRANSITION_FRAME_DURATION = 60
+TRANSITION_HOLD = 1000
+
 PRINTABLE = (
     " ABCDEFGHIJKLMNOPQRSTUVWXYZ1234567890!@#$() - +&=;: '\"%,.  /? °🟥🟧🟨🟩🟦🟪⬜⬛■"
 )
@@ -58,6 +76,80 @@ def construct_message(message: str, **kwargs: Any) -> list[list[int]]:
     return encode_text(message, align=align, valign=valign)
 
 
+def construct_canvas(
+    message: str, rows: int, columns: int, **kwargs: Any
+) -> list[list[int]]:
+    """Construct a message laid out across a canvas of any size.
+
+    Text wraps at blanks and is aligned like `construct_message`, which is
+    limited to a single board.
+    """
+    message = "".join(EMOJI_MAP.get(char, char) for char in message)
+    align = kwargs.get(CONF_JUSTIFY, ALIGN_CENTER)
+    valign = kwargs.get(CONF_ALIGN, ALIGN_CENTER)
+    lines: list[list[int]] = []
+    for line in map(encode, message.splitlines()):
+        while len(line) > columns:
+            # Break at the last blank that fits, or mid-word if there isn't one
+            end = next((pos for pos in range(columns, 0, -1) if line[pos] == 0), None)
+            lines.append(line[: end or columns])
+            line = line[end + 1 :] if end else line[columns:]
+        lines.append(line)
+    lines = lines[:rows]
+
+    def _align(line: list[int]) -> list[int]:
+        pad = columns - len(line)
+        if align == ALIGN_LEFT:
+            return line + [0] * pad
+        if align == ALIGN_RIGHT:
+            return [0] * pad + line
+        return [0] * (pad // 2) + line + [0] * (pad - pad // 2)
+
+    pad = rows - len(lines)
+    top = {ALIGN_TOP: 0, ALIGN_BOTTOM: pad}.get(valign, pad // 2)
+    return (
+        [[0] * columns for _ in range(top)]
+        + [_align(line) for line in lines]
+        + [[0] * columns for _ in range(pad - top)]
+    )
+
+
+def split_canvas(
+    canvas: list[list[int]], rows: int, columns: int
+) -> list[list[list[int]]]:
+    """Split a canvas into board-sized grids, left to right and top to bottom."""
+    return [
+        [row[left : left + columns] for row in canvas[top : top + rows]]
+        for top in range(0, len(canvas), rows)
+        for left in range(0, len(canvas[0]), columns)
+    ]
+
+
+def same_shape(old: list[list[int]], new: list[list[int]]) -> bool:
+    """Return whether two grids have the same rows and columns."""
+    return len(old) == len(new) and all(
+        len(old_codes) == len(new_codes) for old_codes, new_codes in zip(old, new)
+    )
+
+
+def diff_grid(old: list[list[int]], new: list[list[int]]) -> list[int]:
+    """Return changed cells as a flat list of `index, code` pairs.
+
+    The index is `row * columns + column`, so a single flip costs two numbers.
+    Both grids must have the same shape, see `same_shape`.
+    """
+    columns = len(new[0])
+    return [
+        value
+        for row, (old_codes, new_codes) in enumerate(zip(old, new, strict=True))
+        for column, (old_code, new_code) in enumerate(
+            zip(old_codes, new_codes, strict=True)
+        )
+        if old_code != new_code
+        for value in (row * columns + column, new_code)
+    ]
+
+
 def create_client(data: dict[str, Any]) -> LocalClient:
     """Create a Vestaboard local client."""
     url = f"http://{data['host']}:7000"
@@ -70,88 +162,234 @@ def create_client(data: dict[str, Any]) -> LocalClient:
     return LocalClient(local_api_key=key, base_url=url, http_client=http_client)
 
 
+async def async_probe_client(hass: HomeAssistant, data: dict[str, Any]) -> str | None:
+    """Check the local API is reachable, returning the API key if it's valid.
+
+    Unlike `create_client`, this only reads from the board and doesn't block.
+    """
+    client = get_async_client(hass)
+    url = f"http://{data[CONF_HOST]}:7000/local-api"
+    key = data[CONF_API_KEY]
+    try:
+        if data.get(CONF_ENABLEMENT_TOKEN):
+            response = await client.post(
+                f"{url}/enablement",
+                headers={"X-Vestaboard-Local-Api-Enablement-Token": key},
+                timeout=PROBE_TIMEOUT,
+            )
+            response.raise_for_status()
+            if not (key := response.json().get("apiKey")):
+                return None
+        response = await client.get(
+            f"{url}/message",
+            headers={"X-Vestaboard-Local-Api-Key": key},
+            timeout=PROBE_TIMEOUT,
+        )
+        response.raise_for_status()
+        return key if response.json().get("message") else None
+    except ValueError:  # Not JSON
+        return None
+
+
 def create_png(
     data: list[list[int]], color: str = MODEL_BLACK, height: int = 1080
 ) -> bytes:
-    model = VestaboardModel.from_name(color)
-
-    width = int(height * model.aspect_ratio)
-    n_cols = model.columns
+    """Create a png for the message from the Vestaboard."""
+    return _encode_png(_draw_board(data, color, height))
 
-    # Derive scale from target height to preserve original proportions
-    scale = height / 1.77
 
-    # Tile sizes
-    tile_w = scale * 0.09
-    tile_h = scale * 0.11
+def create_png_variants(
+    data: list[list[int]], color: str, heights: Iterable[int]
+) -> dict[int, bytes]:
+    """Create pngs at several heights from a single render.
 
-    # Padding / start
-    start = 0.2
+    Only the largest height is drawn; smaller ones are downscaled from it,
+    keeping the model's aspect ratio.
+    """
+    heights = sorted(set(heights), reverse=True)
+    model = VestaboardModel.from_name(color)
+    img = _draw_board(data, color, heights[0])
+    variants = {heights[0]: _encode_png(img)}
+    for height in heights[1:]:
+        width = int(height * model.aspect_ratio)
+        factor, remainder = divmod(img.height, height)
+        if not remainder and img.width // factor == width:
+            # Box reduction by a whole factor is much cheaper than resampling
+            variant = img.reduce(factor, box=(0, 0, width * factor, img.height))
+        else:
+            variant = img.resize((width, height), Image.Resampling.LANCZOS)
+        variants[height] = _encode_png(variant)
+    return variants
+
+
+def create_png_batch(
+    grids: list[list[list[int]]], color: str, height: int
+) -> list[bytes]:
+    """Create a png for each grid, rendering repeated grids only once."""
+    rendered: dict[str, bytes] = {}
+    for data in grids:
+        if (key := repr(data)) not in rendered:
+            rendered[key] = create_png(data, color, height)
+    return [rendered[repr(data)] for data in grids]
+
+
+def create_contact_sheet(
+    grids: list[list[list[int]]], color: str, height: int, columns: int
+) -> bytes:
+    """Create a single png laying out a board image for each grid."""
+    model = VestaboardModel.from_name(color)
+    width = int(height * model.aspect_ratio)
+    gap = max(height // 20, 1)
+    columns = max(min(columns, len(grids)), 1)
+    rows = -(-len(grids) // columns)
+    sheet = Image.new(
+        "RGB",
+        (columns * (width + gap) + gap, rows * (height + gap) + gap),
+        color=model.bit_color,
+    )
+    rendered: dict[str, Image.Image] = {}
+    for index, data in enumerate(grids):
+        if (key := repr(data)) not in rendered:
+            rendered[key] = _draw_board(data, color, height)
+        row, column = divmod(index, columns)
+        sheet.paste(
+            rendered[key], (gap + column * (width + gap), gap + row * (height + gap))
+        )
+    return _encode_png(sheet)
+
+
+def _encode_png(img: Image.Image) -> bytes:
+    """Encode an image as png."""
+    buffer = io.BytesIO()
+    img.save(buffer, format="PNG")
+    return buffer.getvalue()
 
-    # Column spacing to fit first/last column exactly
-    column_multiplier = ((width - start * scale * 2) - n_cols * tile_w) / (n_cols - 1)
 
-    # Row multiplier same as original
-    row_multiplier = 0.24
+def _draw_board(data: list[list[int]], color: str, height: int) -> Image.Image:
+    """Draw the board at a height."""
+    layout = get_layout(color, height)
 
-    # Create image
-    img = Image.new("RGB", (width, height), color=model.frame_color)
+    img = Image.new("RGB", (layout.width, layout.height), color=layout.frame)
     draw = ImageDraw.Draw(img)
 
     # Board background
     draw.rectangle(
-        [(0, 0), (width, height)],
-        outline=model.bit_color,
-        width=int(scale * 0.02),
+        [(0, 0), (layout.width, layout.height)],
+        outline=layout.bit,
+        width=layout.border_width,
     )
 
-    # Font
-    font = load_font(int(tile_h * 1.1))
-
-    # Draw tiles and characters
-    for row, characters in enumerate(data):
-        for column, code in enumerate(characters):
-            xpos = start * scale + column * column_multiplier + tile_w * column
-            ypos = start * scale + row * row_multiplier * scale
-
-            if code in (c.value for c in Color):
-                draw.rectangle(
-                    [(xpos, ypos), (xpos + tile_w, ypos + tile_h * 0.84)],
-                    fill=model.color_map[code],
-                )
-                offset = 0.001 * scale * 0.84
-                draw.rectangle(
-                    [
-                        (xpos, ypos + tile_h * 0.84 / 2 - offset),
-                        (xpos + tile_w, ypos + tile_h * 0.84 / 2 + offset),
-                    ],
-                    fill=model.frame_color,
-                )
-            else:
-                char = symbol(code)
+    font = load_font(layout.font_size)
 
-                cx = xpos + tile_w / 2
-                cy = ypos + tile_h / 2
-                draw.text((cx, cy), char, fill=model.text_color, font=font, anchor="mm")
+    for row_tiles, characters in zip(layout.tiles, data):
+        for tile, code in zip(row_tiles, characters):
+            _draw_tile(draw, layout, tile, code, font)
 
-    # Logo text
-    logo_font = load_font(int(0.048 * scale))
     draw.text(
-        (width / 2, scale * 1.64),
+        layout.logo,
         "VESTABOARD",
-        fill=model.bit_color,
+        fill=layout.bit,
         anchor="mm",
-        font=logo_font,
+        font=load_font(layout.logo_font_size),
     )
 
+    return img
+
+
+def _draw_tile(
+    draw: ImageDraw.ImageDraw,
+    layout: BoardLayout,
+    tile: Tile,
+    code: int,
+    font: ImageFont.FreeTypeFont,
+) -> None:
+    """Draw a single tile."""
+    if (fill := layout.colors.get(code)) is not None:
+        draw.rectangle(tile.flap, fill=fill)
+        draw.rectangle(tile.split, fill=layout.frame)
+    else:
+        draw.text(tile.center, symbol(code), fill=layout.text, font=font, anchor="mm")
+
+
+def create_transition(
+    old: list[list[int]],
+    new: list[list[int]],
+    color: str = MODEL_BLACK,
+    height: int = 540,
+    frames: int = TRANSITION_FRAMES,
+) -> bytes:
+    """Create an animated png of the board flipping from one grid to another.
+
+    Changed tiles cycle through the characters between their old and new codes
+    the way the drums turn, and unchanged tiles stay put. Each frame is the
+    previous one with the tiles that moved pasted from a sprite drawn once per
+    code, so the animation costs little more than the first and last renders.
+    """
+    layout = get_layout(color, height)
+    font = load_font(layout.font_size)
+    first = _draw_board(old, color, height)
+    last = _draw_board(new, color, height)
+
+    # Every sprite puts its tile at the same offset within its cell
+    origin = layout.tiles[0][0]
+    dx, dy = -origin.cell[0], -origin.cell[1]
+    sprite_tile = Tile(
+        (*_shift(origin.flap[:2], dx, dy), *_shift(origin.flap[2:], dx, dy)),
+        (*_shift(origin.split[:2], dx, dy), *_shift(origin.split[2:], dx, dy)),
+        _shift(origin.center, dx, dy),
+        (0, 0),
+    )
+    sprites: dict[int, Image.Image] = {}
+
+    def _sprite(code: int) -> Image.Image:
+        if (sprite := sprites.get(code)) is None:
+            sprite = Image.new("RGB", layout.cell_size, color=layout.frame)
+            _draw_tile(ImageDraw.Draw(sprite), layout, sprite_tile, code, font)
+            sprites[code] = sprite
+        return sprite
+
+    # Each changed tile with its old code, distance to turn and shown code
+    flips = [
+        [tile, old_code, (new_code - old_code) % FLIP_CODES, old_code]
+        for row_tiles, old_row, new_row in zip(layout.tiles, old, new)
+        for tile, old_code, new_code in zip(row_tiles, old_row, new_row)
+        if old_code != new_code
+    ]
+    images = [first]
+    frame = first
+    for step in range(1, frames - 1):
+        frame = frame.copy()
+        for flip in flips:
+            tile, start, distance, shown = flip
+            code = (start + distance * step // (frames - 1)) % FLIP_CODES
+            if code != shown:
+                frame.paste(_sprite(code), tile.cell)
+                flip[3] = code
+        images.append(frame)
+    images.append(last)
+
+    durations = [TRANSITION_FRAME_DURATION] * (len(images) - 1)
     buffer = io.BytesIO()
-    img.save(buffer, format="PNG")
+    first.save(
+        buffer,
+        format="PNG",
+        save_all=True,
+        append_images=images[1:],
+        duration=[*durations, TRANSITION_HOLD],
+        loop=1,
+    )
     return buffer.getvalue()
 
 
+def _shift(point: tuple[float, ...], dx: float, dy: float) -> tuple[float, float]:
+    """Return a point moved by an offset."""
+    return point[0] + dx, point[1] + dy
+
+
 def create_svg(data: list[list[int]], color: str = MODEL_BLACK) -> str:
     """Create an svg for the message from the Vestaboard."""
-    model = VestaboardModel(color)
+    layout = get_layout(color, SVG_HEIGHT)
+    colors = layout.colors
 
     encoded_font = base64.b64encode(get_font_bytes()).decode("ascii")
     font_face = f"""@font-face {{
@@ -159,28 +397,35 @@ def create_svg(data: list[list[int]], color: str = MODEL_BLACK) -> str:
         src: url("data:font/otf;base64,{encoded_font}") format("opentype");
       }}"""
 
-    svg = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 4 1.77" version="1.1">'
+    border = layout.border_width
+    svg = (
+        '<svg xmlns="http://www.w3.org/2000/svg" '
+        f'viewBox="0 0 {layout.width} {layout.height}" version="1.1">'
+    )
     svg += f"<style> {font_face} </style>"
-    svg += '<style> svg { font-family: "Vestaboard", "Regular", sans-serif; text-anchor: middle; }'
-    svg += f".board {{ fill: {model.frame_color}; stroke: {model.bit_color}; stroke-width: 0.02; }}"
-    svg += f".char {{ font-size: 0.14px; width: 0.09px; height: 0.11px; }} text.char {{ fill: {model.text_color}; transform: translateY(0.105px); }}"
-    svg += " ".join(
-        f".{Color(k).name.lower()} {{ fill: {v}; }}" for k, v in model.color_map.items()
+    svg += '<style> svg { font-family: "Vestaboard", "Regular", sans-serif; text-anchor: middle; dominant-baseline: central; }'
+    svg += f".board {{ fill: {hex_color(layout.frame)}; stroke: {hex_color(layout.bit)}; stroke-width: {border}; }}"
+    svg += (
+        f".char {{ font-size: {layout.font_size}px; fill: {hex_color(layout.text)}; }} "
     )
-    svg += f".logo {{ font-size: 0.10px; fill: {model.bit_color}; }} </style>"
-    svg += '<rect class="board" x="0.01" y="0.01" width="3.98" height="1.75" />'
-    start = 0.2
-    row_multiplier = 0.24
-    column_multiplier = 0.166
-    for row, characters in enumerate(data):
-        for column, code in enumerate(characters):
-            xpos = round(start + column * column_multiplier, 3)
-            ypos = round(start + row * row_multiplier, 3)
-            if code in (c.value for c in Color):
-                svg += f'<rect class="char {Color(code).name.lower()}" x="{xpos}" y="{ypos}"/>'
+    svg += " ".join(f".c{k} {{ fill: {hex_color(v)}; }}" for k, v in colors.items())
+    svg += f" .logo {{ font-size: {layout.logo_font_size}px; fill: {hex_color(layout.bit)}; }} </style>"
+    svg += (
+        f'<rect class="board" x="{border / 2}" y="{border / 2}" '
+        f'width="{layout.width - border}" height="{layout.height - border}" />'
+    )
+    width = round(layout.tile_width, 2)
+    height = round(layout.tile_height * FLAP_RATIO, 2)
+    for row_tiles, characters in zip(layout.tiles, data):
+        for tile, code in zip(row_tiles, characters):
+            if code in colors:
+                x, y = round(tile.flap[0], 2), round(tile.flap[1], 2)
+                svg += f'<rect class="c{code}" x="{x}" y="{y}" width="{width}" height="{height}"/>'
             else:
-                svg += f'<text class="char" x="{xpos + 0.045}" y="{ypos}">{symbol(code).replace("&", "&amp;")}</text>'
-    svg += '<text class="logo" x="50%" y="1.68">VESTABOARD</text></svg>'
+                x, y = round(tile.center[0], 2), round(tile.center[1], 2)
+                svg += f'<text class="char" x="{x}" y="{y}">{symbol(code).replace("&", "&amp;")}</text>'
+    x, y = round(layout.logo[0], 2), round(layout.logo[1], 2)
+    svg += f'<text class="logo" x="{x}" y="{y}">VESTABOARD</text></svg>'
     return svg
 
 
@@ -199,10 +444,8 @@ def symbol(code: int) -> str:
 
 
 @callback
-def async_get_coordinator_by_device_id(
-    hass: HomeAssistant, device_id: str
-) -> VestaboardCoordinator:
-    """Get the Vestaboard coordinator for this device ID."""
+def async_get_entry_by_device_id(hass: HomeAssistant, device_id: str) -> ConfigEntry:
+    """Get the Vestaboard config entry for this device ID."""
     device_registry = dr.async_get(hass)
 
     if (device_entry := device_registry.async_get(device_id)) is None:
@@ -212,6 +455,17 @@ def async_get_coordinator_by_device_id(
         if (
             entry := hass.config_entries.async_get_entry(entry_id)
         ) and entry.domain == DOMAIN:
-            return entry.runtime_data
+            return entry
 
     raise ValueError(f"No coordinator for device ID: {device_id}")
+
+
+@callback
+def async_get_coordinator_by_device_id(
+    hass: HomeAssistant, device_id: str
+) -> VestaboardCoordinator:
+    """Get the Vestaboard coordinator for this device ID."""
+    entry = async_get_entry_by_device_id(hass, device_id)
+    if CONF_BOARDS in entry.data:
+        raise ValueError(f"Device ID {device_id} is a wall, not a single Vestaboard")
+    return entry.runtime_data
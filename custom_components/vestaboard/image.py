@@ -3,15 +3,21 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Any
 
 from homeassistant.components.image import ImageEntity, ImageEntityDescription
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .const import CONF_ANIMATE_TRANSITIONS, DOMAIN
 from .coordinator import VestaboardConfigEntry
 from .entity import VestaboardEntity
+from .wall import VestaboardWall, VestaboardWallConfigEntry
 
 IMAGE = ImageEntityDescription(key="board", name=None)
+TRANSITION = ImageEntityDescription(key="transition", translation_key="transition")
 
 
 async def async_setup_entry(
@@ -20,7 +26,13 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Vestaboard camera using config entry."""
-    async_add_entities([VestaboardImageEntity(entry, IMAGE)])
+    if isinstance(entry.runtime_data, VestaboardWall):
+        async_add_entities([VestaboardWallImageEntity(entry, IMAGE)])
+        return
+    entities = [VestaboardImageEntity(entry, IMAGE)]
+    if entry.options.get(CONF_ANIMATE_TRANSITIONS, False):
+        entities.append(VestaboardTransitionImageEntity(entry, TRANSITION))
+    async_add_entities(entities)
 
 
 class VestaboardImageEntity(VestaboardEntity, ImageEntity):
@@ -45,3 +57,57 @@ class VestaboardImageEntity(VestaboardEntity, ImageEntity):
     def image(self) -> bytes | None:
         """Return bytes of image."""
         return self.coordinator.image
+
+    def _state_dependency(self) -> Any:
+        """Return the coordinator state this entity's state is derived from."""
+        return self.coordinator.last_updated
+
+
+class VestaboardTransitionImageEntity(VestaboardImageEntity):
+    """Animation of the board flipping to its latest message."""
+
+    @property
+    def image_last_updated(self) -> datetime | None:
+        """The time when the image was last updated."""
+        return self.coordinator.transition_updated
+
+    def image(self) -> bytes | None:
+        """Return bytes of image."""
+        return self.coordinator.transition
+
+    def _state_dependency(self) -> Any:
+        """Return the coordinator state this entity's state is derived from."""
+        return self.coordinator.transition_updated
+
+
+class VestaboardWallImageEntity(CoordinatorEntity[VestaboardWall], ImageEntity):
+    """Preview of a wall of Vestaboards."""
+
+    _attr_content_type = "image/png"
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        entry: VestaboardWallConfigEntry,
+        description: ImageEntityDescription,
+    ) -> None:
+        """Initialize the entity."""
+        super().__init__(entry.runtime_data)
+        ImageEntity.__init__(self, entry.runtime_data.hass)
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.entry_id}-{description.key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name=entry.title,
+            manufacturer="Vestaboard",
+            model="Vestaboard wall",
+        )
+
+    @property
+    def image_last_updated(self) -> datetime | None:
+        """The time when the image was last updated."""
+        return self.coordinator.last_updated
+
+    def image(self) -> bytes | None:
+        """Return bytes of image."""
+        return self.coordinator.image
@@ -0,0 +1,143 @@
+"""Board layouts for the Vestaboard integration."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Final, NamedTuple
+
+from PIL import ImageColor
+from vesta import Color
+
+from .vestaboard_model import VestaboardModel
+
+# Proportions of a flagship board, relative to its height of 1.77
+BOARD_HEIGHT: Final = 1.77
+PADDING: Final = 0.2
+GRID_BOTTOM: Final = 1.51
+TILE_WIDTH: Final = 0.09
+TILE_HEIGHT: Final = 0.11
+COLUMN_GAP: Final = 0.044
+ROW_PITCH: Final = 0.24
+FLAP_RATIO: Final = 0.84
+SPLIT_WIDTH: Final = 0.001
+BORDER_WIDTH: Final = 0.02
+FONT_RATIO: Final = 1.1
+LOGO_Y: Final = 1.64
+LOGO_FONT_SIZE: Final = 0.048
+
+type RGB = tuple[int, int, int]
+type Box = tuple[float, float, float, float]
+
+COLOR_CODES: Final = frozenset(color.value for color in Color)
+
+
+class Tile(NamedTuple):
+    """Where a single bit is drawn."""
+
+    flap: Box
+    split: Box
+    center: tuple[float, float]
+    cell: tuple[int, int]
+
+
+@dataclass(frozen=True, slots=True)
+class BoardLayout:
+    """The geometry and resolved colors for drawing a model at a height."""
+
+    model: str
+    width: int
+    height: int
+    border_width: int
+    tile_width: float
+    tile_height: float
+    font_size: int
+    cell_size: tuple[int, int]
+    cell_margin: float
+    tiles: tuple[tuple[Tile, ...], ...]
+    logo: tuple[float, float]
+    logo_font_size: int
+    frame: RGB
+    bit: RGB
+    text: RGB
+    colors: Mapping[int, RGB]
+
+
+@lru_cache(maxsize=32)
+def get_layout(model_name: str, height: int) -> BoardLayout:
+    """Return the layout of a model at a height.
+
+    Bits keep the flagship's proportions and are scaled up to fill the space
+    above the logo, so boards with fewer, larger bits lay out correctly.
+    """
+    model = VestaboardModel.from_name(model_name)
+    rows, columns = model.rows, model.columns
+    width = int(height * model.aspect_ratio)
+    scale = height / BOARD_HEIGHT
+
+    area_width = width - 2 * PADDING * scale
+    area_height = (GRID_BOTTOM - PADDING) * scale
+    factor = min(
+        area_height / (((rows - 1) * ROW_PITCH + TILE_HEIGHT) * scale),
+        area_width / ((columns * TILE_WIDTH + (columns - 1) * COLUMN_GAP) * scale),
+    )
+    tile_width = TILE_WIDTH * factor * scale
+    tile_height = TILE_HEIGHT * factor * scale
+    flap_height = tile_height * FLAP_RATIO
+    split = SPLIT_WIDTH * scale * FLAP_RATIO
+
+    # Columns span the full width, rows are centered in the space above the logo
+    column_pitch = tile_width + (area_width - columns * tile_width) / (columns - 1)
+    row_pitch = ROW_PITCH * factor * scale
+    top = PADDING * scale + (area_height - (rows - 1) * row_pitch - tile_height) / 2
+    # Cells reach halfway into the gaps, so a tile can be redrawn on its own
+    margin = (column_pitch - tile_width) / 2
+
+    tiles = []
+    for row in range(rows):
+        y = top + row * row_pitch
+        row_tiles = []
+        for column in range(columns):
+            x = PADDING * scale + column * column_pitch
+            middle = y + flap_height / 2
+            row_tiles.append(
+                Tile(
+                    (x, y, x + tile_width, y + flap_height),
+                    (x, middle - split, x + tile_width, middle + split),
+                    (x + tile_width / 2, y + tile_height / 2),
+                    (round(x - margin), round(y - margin)),
+                )
+            )
+        tiles.append(tuple(row_tiles))
+
+    return BoardLayout(
+        model=model_name,
+        width=width,
+        height=height,
+        border_width=int(scale * BORDER_WIDTH),
+        tile_width=tile_width,
+        tile_height=tile_height,
+        font_size=int(tile_height * FONT_RATIO),
+        cell_size=(int(column_pitch), int(tile_height + 2 * margin)),
+        cell_margin=margin,
+        tiles=tuple(tiles),
+        logo=(width / 2, scale * LOGO_Y),
+        logo_font_size=int(scale * LOGO_FONT_SIZE),
+        frame=ImageColor.getrgb(model.frame_color)[:3],
+        bit=ImageColor.getrgb(model.bit_color)[:3],
+        text=ImageColor.getrgb(model.text_color)[:3],
+        colors=MappingProxyType(
+            {
+                code: ImageColor.getrgb(value)[:3]
+                for code, value in model.color_map.items()
+                if code in COLOR_CODES
+            }
+        ),
+    )
+
+
+def hex_color(rgb: RGB) -> str:
+    """Return an RGB tuple as a hex color."""
+    return "#{:02x}{:02x}{:02x}".format(*rgb)
@@ -13,9 +13,9 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers import issue_registry as ir
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
-from .const import DOMAIN
+from .const import CONF_MESSAGE, DOMAIN
 from .coordinator import VestaboardCoordinator
-from .helpers import construct_message
+from .services import async_compose_message
 
 
 async def async_get_service(
@@ -33,23 +33,28 @@ class VestaboardNotificationService(BaseNotificationService):
     def __init__(self, config: dict[str, Any]) -> None:
         """Initialize the service."""
         self.coordinator: VestaboardCoordinator = config["coordinator"]
+        self._issue_created = False
 
-    def send_message(self, message: str, **kwargs: Any) -> None:
+    async def async_send_message(self, message: str = "", **kwargs: Any) -> None:
         """Send a message to a Vestaboard."""
-        ir.create_issue(
-            self.hass,
-            DOMAIN,
-            f"deprecated_{NOTIFY_DOMAIN}_{DOMAIN}_{self._service_name}",
-            is_fixable=False,
-            issue_domain=DOMAIN,
-            severity=ir.IssueSeverity.WARNING,
-            translation_key=f"deprecated_{NOTIFY_DOMAIN}_{DOMAIN}",
-            translation_placeholders={"action_name": self._service_name},
-        )
-
-        if self.coordinator.quiet_hours():
-            return
-
-        if not (data := kwargs.get(ATTR_DATA)):
-            data = {}
-        self.coordinator.vestaboard.write_message(construct_message(message, **data))
+        if not self._issue_created:
+            ir.async_create_issue(
+                self.hass,
+                DOMAIN,
+                f"deprecated_{NOTIFY_DOMAIN}_{DOMAIN}_{self._service_name}",
+                is_fixable=False,
+                issue_domain=DOMAIN,
+                severity=ir.IssueSeverity.WARNING,
+                translation_key=f"deprecated_{NOTIFY_DOMAIN}_{DOMAIN}",
+                translation_placeholders={"action_name": self._service_name},
+            )
+            self._issue_created = True
+
+        data = kwargs.get(ATTR_DATA) or {}
+        rows = await async_compose_message(self.hass, data | {CONF_MESSAGE: message})
+        coordinator = self.coordinator
+        coordinator.playlists.async_stop()
+        if template := coordinator.scheduled_template:
+            template.async_remove(coordinator)
+        # Repeated notifications often carry the same message
+        await coordinator.async_set_persistent_message(rows, skip_if_displayed=True)
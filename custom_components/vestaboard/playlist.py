@@ -0,0 +1,186 @@
+"""Playlist rotation for the Vestaboard integration."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import logging
+from typing import TYPE_CHECKING, Any, NotRequired, TypedDict
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .coordinator import VestaboardCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+
+class StoredFrame(TypedDict):
+    """Stored playlist frame."""
+
+    rows: list[list[int]]
+    dwell: int
+
+
+class StoredPlaylists(TypedDict):
+    """Stored playlists for a board."""
+
+    playlists: dict[str, list[StoredFrame]]
+    active: str | None
+    index: NotRequired[int]
+
+
+@dataclass(slots=True)
+class PlaylistFrame:
+    """A compiled and pre-rendered playlist frame."""
+
+    rows: list[list[int]]
+    dwell: timedelta
+    image: bytes
+
+
+def async_get_playlist_store(
+    hass: HomeAssistant, entry_id: str
+) -> Store[StoredPlaylists]:
+    """Return the store holding the playlists of a board."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.playlists")
+
+
+class PlaylistManager:
+    """Store playlists for a board and rotate through the active one.
+
+    Frames are stored already compiled to grids and are rendered once when a
+    playlist starts, so advancing only writes to the board.
+    """
+
+    def __init__(self, coordinator: VestaboardCoordinator) -> None:
+        """Initialize."""
+        self.coordinator = coordinator
+        self.hass = coordinator.hass
+        self._store = async_get_playlist_store(
+            self.hass, coordinator.config_entry.entry_id
+        )
+        self.playlists: dict[str, list[StoredFrame]] = {}
+        self.active: str | None = None
+        self._frames: list[PlaylistFrame] = []
+        self._index = 0
+        self._unsub: CALLBACK_TYPE | None = None
+
+    async def async_load(self) -> None:
+        """Load stored playlists and resume the active one.
+
+        The board still shows the frame it was on, so that frame is not
+        written again and the rotation continues from it.
+        """
+        if data := await self._store.async_load():
+            self.playlists = data["playlists"]
+            if stored := self.playlists.get(name := data["active"]):
+                self._frames = await self._async_render(stored)
+                self._index = data.get("index", 0) % len(self._frames)
+                self.active = name
+                self._unsub = async_call_later(
+                    self.hass, self._frames[self._index].dwell, self._async_advance
+                )
+
+    async def async_set(self, name: str, frames: list[StoredFrame]) -> None:
+        """Create or replace a playlist."""
+        self.playlists[name] = frames
+        if self.active == name:
+            await self.async_start(name)
+        else:
+            self._async_save()
+
+    async def async_delete(self, name: str) -> None:
+        """Delete a playlist."""
+        if self.playlists.pop(name, None) is None:
+            raise HomeAssistantError(f"Unknown playlist: {name}")
+        if self.active == name:
+            self.async_stop()
+        self._async_save()
+
+    async def async_start(self, name: str) -> None:
+        """Render every frame of a playlist and start rotating through it."""
+        if not (stored := self.playlists.get(name)):
+            raise HomeAssistantError(f"Unknown playlist: {name}")
+        self.async_stop()
+        self._frames = await self._async_render(stored)
+        self._index = 0
+        self.active = name
+        self._async_save()
+        await self._async_show_frame()
+
+    async def _async_render(self, stored: list[StoredFrame]) -> list[PlaylistFrame]:
+        """Render the frames of a playlist."""
+        coordinator = self.coordinator
+        images: dict[str, bytes] = {}
+        frames = []
+        for frame in stored:
+            key = repr(frame["rows"])
+            if key not in images:
+                images[key] = await coordinator.renderer.async_render_png(
+                    frame["rows"],
+                    coordinator.model,
+                    use_process=coordinator.render_process,
+                )
+            frames.append(
+                PlaylistFrame(
+                    frame["rows"], timedelta(seconds=frame["dwell"]), images[key]
+                )
+            )
+        return frames
+
+    @callback
+    def async_unload(self) -> None:
+        """Cancel the rotation timer, keeping the active playlist stored."""
+        if self._unsub:
+            self._unsub()
+            self._unsub = None
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop rotating."""
+        self.async_unload()
+        if self.active is not None:
+            self.active = None
+            self._frames = []
+            self._async_save()
+
+    async def _async_show_frame(self) -> None:
+        """Show the current frame and schedule the next one."""
+        frame = self._frames[self._index]
+        self._unsub = async_call_later(self.hass, frame.dwell, self._async_advance)
+        try:
+            await self.coordinator.async_set_persistent_message(
+                frame.rows, image=frame.image
+            )
+        except HomeAssistantError as err:
+            _LOGGER.warning("Unable to show playlist %s: %s", self.active, err)
+
+    async def _async_advance(self, now: datetime) -> None:
+        """Advance to the next frame, holding position during quiet hours."""
+        self._unsub = None
+        if not self.coordinator.quiet_hours():
+            self._index = (self._index + 1) % len(self._frames)
+            self._async_save()
+        await self._async_show_frame()
+
+    @callback
+    def _async_save(self) -> None:
+        """Save playlists."""
+        self._store.async_delay_save(self._data_to_save, 1)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return data to save."""
+        return {
+            "playlists": self.playlists,
+            "active": self.active,
+            "index": self._index,
+        }
@@ -0,0 +1,116 @@
+"""Quiet hours schedule for the Vestaboard integration."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from datetime import date, datetime, time, timedelta
+from typing import Any, Final, Self
+
+import homeassistant.util.dt as dt_util
+
+WEEKDAYS: Final = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+
+type Window = tuple[time, time]
+
+
+def parse_window(value: str) -> Window:
+    """Parse a `HH:MM-HH:MM` window.
+
+    A window ending at or before its start continues into the next day, so
+    `00:00-00:00` covers a whole day.
+    """
+    start, _, end = value.partition("-")
+    if (start_time := dt_util.parse_time(start.strip())) is None or (
+        end_time := dt_util.parse_time(end.strip())
+    ) is None:
+        raise ValueError(f"Invalid quiet hours window: {value!r}")
+    return start_time, end_time
+
+
+class QuietHoursSchedule:
+    """Weekly quiet hours windows with per-date exceptions."""
+
+    def __init__(
+        self,
+        weekly: Mapping[int, list[Window]],
+        exceptions: Mapping[date, list[Window]],
+    ) -> None:
+        """Initialize."""
+        self.weekly = weekly
+        self.exceptions = exceptions
+
+    @classmethod
+    def from_config(
+        cls,
+        schedule: Mapping[str, Any] | None,
+        start: str | None = None,
+        end: str | None = None,
+    ) -> Self | None:
+        """Create a schedule from options, returning None if there is none.
+
+        `schedule` maps weekday names (`mon`..`sun`) or ISO dates to lists of
+        windows, with dates replacing the weekly windows for that day. The
+        legacy `start`/`end` window applies to every weekday.
+        """
+        weekly: dict[int, list[Window]] = {day: [] for day in range(7)}
+        exceptions: dict[date, list[Window]] = {}
+        if start and end and start != end:
+            window = (dt_util.parse_time(start), dt_util.parse_time(end))
+            for windows in weekly.values():
+                windows.append(window)
+        for key, values in (schedule or {}).items():
+            windows = [parse_window(value) for value in values or []]
+            if (weekday := str(key).lower()[:3]) in WEEKDAYS:
+                weekly[WEEKDAYS.index(weekday)].extend(windows)
+            elif (day := dt_util.parse_date(str(key))) is not None:
+                exceptions[day] = windows
+            else:
+                raise ValueError(f"Invalid quiet hours day: {key!r}")
+        if not exceptions and not any(weekly.values()):
+            return None
+        return cls(weekly, exceptions)
+
+    def _windows(self, day: date) -> list[Window]:
+        """Return the windows starting on a day."""
+        if day in self.exceptions:
+            return self.exceptions[day]
+        return self.weekly[day.weekday()]
+
+    def _intervals(self, start: date, days: int) -> list[tuple[datetime, datetime]]:
+        """Return merged quiet intervals for windows starting in a date range."""
+        tz = dt_util.get_default_time_zone()
+        intervals = []
+        for offset in range(days):
+            day = start + timedelta(days=offset)
+            for window_start, window_end in self._windows(day):
+                begin = datetime.combine(day, window_start, tz)
+                finish = datetime.combine(day, window_end, tz)
+                if finish <= begin:
+                    finish += timedelta(days=1)
+                intervals.append((begin, finish))
+        intervals.sort()
+        merged: list[tuple[datetime, datetime]] = []
+        for begin, finish in intervals:
+            if merged and begin <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], finish))
+            else:
+                merged.append((begin, finish))
+        return merged
+
+    def is_quiet(self, when: datetime) -> bool:
+        """Return True if quiet hours are in effect."""
+        return any(
+            begin <= when < finish
+            for begin, finish in self._intervals(when.date() - timedelta(days=1), 2)
+        )
+
+    def next_transition(self, when: datetime) -> datetime | None:
+        """Return when quiet hours next start or end after a point in time."""
+        # Look back a day for windows running past midnight and ahead far enough
+        # to cover a week of windows plus the date exceptions in it
+        for begin, finish in self._intervals(when.date() - timedelta(days=1), 9):
+            if begin > when:
+                return begin
+            if finish > when:
+                return finish
+        return None
@@ -0,0 +1,282 @@
+"""Rendering backends for the Vestaboard integration."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import logging
+import multiprocessing
+import os
+from typing import Any, Final
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
+
+from .helpers import (
+    create_contact_sheet,
+    create_png,
+    create_png_batch,
+    create_png_variants,
+    create_transition,
+)
+from .vestaboard_model import VestaboardModel
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_HEIGHT: Final = 1080
+IMAGE_HEIGHTS: Final = (270, 540, DEFAULT_HEIGHT, 2160)
+MAX_WORKERS: Final = 4
+RECENT_RENDERS: Final = 16
+TRANSITION_HEIGHT: Final = 540
+
+
+def snap_height(height: int) -> int:
+    """Return the smallest pre-generated image height covering a height."""
+    return next((h for h in IMAGE_HEIGHTS if h >= height), IMAGE_HEIGHTS[-1])
+
+
+def pack_grid(data: list[list[int]]) -> bytes:
+    """Pack a grid of character codes into one byte per tile."""
+    return bytes(code for row in data for code in row)
+
+
+def unpack_grid(packed: bytes, columns: int) -> list[list[int]]:
+    """Unpack a grid packed with `pack_grid`."""
+    return [list(packed[i : i + columns]) for i in range(0, len(packed), columns)]
+
+
+type PackedGrid = tuple[int, bytes]
+
+
+def _pack(data: list[list[int]]) -> PackedGrid:
+    """Pack a grid with its width, so it unpacks to the same shape."""
+    return (len(data[0]) if data else 0), pack_grid(data)
+
+
+def _unpack(packed: PackedGrid) -> list[list[int]]:
+    """Unpack a grid packed with `_pack`."""
+    columns, grid = packed
+    return unpack_grid(grid, columns) if columns else []
+
+
+def _warm_worker() -> None:
+    """Pre-load fonts and model data in a render worker."""
+    for name in VestaboardModel.all_models():
+        model = VestaboardModel.from_name(name)
+        create_png([[0] * model.columns] * model.rows, name, DEFAULT_HEIGHT)
+
+
+def _render_packed(packed: PackedGrid, color: str, height: int) -> bytes:
+    """Render a packed grid to PNG bytes inside a render worker."""
+    return create_png(_unpack(packed), color, height)
+
+
+def _render_packed_variants(
+    packed: PackedGrid, color: str, heights: tuple[int, ...]
+) -> dict[int, bytes]:
+    """Render a packed grid to PNG variants inside a render worker."""
+    return create_png_variants(_unpack(packed), color, heights)
+
+
+def _render_packed_batch(
+    packed: list[PackedGrid], color: str, height: int, columns: int | None
+) -> bytes | list[bytes]:
+    """Render packed grids to PNG bytes or a contact sheet inside a render worker."""
+    grids = [_unpack(grid) for grid in packed]
+    if columns:
+        return create_contact_sheet(grids, color, height, columns)
+    return create_png_batch(grids, color, height)
+
+
+def _render_packed_transition(
+    old: PackedGrid, new: PackedGrid, color: str, height: int
+) -> bytes:
+    """Render the transition between packed grids inside a render worker."""
+    return create_transition(_unpack(old), _unpack(new), color, height)
+
+
+class VestaboardRenderer:
+    """Render board images in a worker process or in-process."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self.hass = hass
+        self._pool: ProcessPoolExecutor | None = None
+        self._pool_failed = False
+        self._pool_lock = asyncio.Lock()
+        self._recent: OrderedDict[Hashable, asyncio.Task[Any]] = OrderedDict()
+
+    @callback
+    def async_setup(self) -> None:
+        """Shut down any worker processes when Home Assistant stops."""
+        self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self._async_stop)
+
+    async def async_render_png(
+        self,
+        data: list[list[int]],
+        color: str,
+        height: int = DEFAULT_HEIGHT,
+        *,
+        use_process: bool = False,
+    ) -> bytes:
+        """Render a grid to PNG bytes, shared with other boards showing it."""
+        packed = _pack(data)
+        return await self._async_shared(
+            ("png", packed, color, height),
+            use_process,
+            _render_packed,
+            packed,
+            color,
+            height,
+        )
+
+    async def async_render_png_variants(
+        self,
+        data: list[list[int]],
+        color: str,
+        heights: tuple[int, ...] = IMAGE_HEIGHTS,
+        *,
+        use_process: bool = False,
+    ) -> dict[int, bytes]:
+        """Render a grid to PNG bytes at several heights, keyed by height."""
+        packed = _pack(data)
+        return await self._async_shared(
+            ("variants", packed, color, heights),
+            use_process,
+            _render_packed_variants,
+            packed,
+            color,
+            heights,
+        )
+
+    async def async_render_batch(
+        self,
+        grids: list[list[list[int]]],
+        color: str,
+        height: int,
+        *,
+        columns: int | None = None,
+        use_process: bool = False,
+    ) -> bytes | list[bytes]:
+        """Render many grids as one job, returning a contact sheet if columns are set.
+
+        Fonts and repeated grids are shared across the batch rather than loaded
+        and drawn for each image.
+        """
+        return await self._async_run(
+            use_process,
+            _render_packed_batch,
+            [_pack(data) for data in grids],
+            color,
+            height,
+            columns,
+        )
+
+    async def async_render_transition(
+        self,
+        old: list[list[int]],
+        new: list[list[int]],
+        color: str,
+        height: int = TRANSITION_HEIGHT,
+        *,
+        use_process: bool = False,
+    ) -> bytes:
+        """Render the board flipping from one grid to another as an animated PNG."""
+        return await self._async_run(
+            use_process,
+            _render_packed_transition,
+            _pack(old),
+            _pack(new),
+            color,
+            height,
+        )
+
+    async def _async_shared(
+        self,
+        key: Hashable,
+        use_process: bool,
+        job: Callable[..., Any],
+        *args: Any,
+    ) -> Any:
+        """Run a render job once for every caller asking for the same result.
+
+        Recent results are kept by reference, so a message sent to many boards
+        with the same model is rendered once and its bytes shared.
+        """
+        if (task := self._recent.get(key)) is None:
+            task = self.hass.async_create_task(self._async_run(use_process, job, *args))
+            self._recent[key] = task
+            if len(self._recent) > RECENT_RENDERS:
+                self._recent.popitem(last=False)
+        else:
+            self._recent.move_to_end(key)
+        try:
+            return await asyncio.shield(task)
+        except Exception:
+            if self._recent.get(key) is task:
+                del self._recent[key]
+            raise
+
+    async def _async_run[T](
+        self, use_process: bool, job: Callable[..., T], *args: Any
+    ) -> T:
+        """Run a render job in a worker process, or the executor as a fallback."""
+        if use_process and (pool := await self._async_get_pool()):
+            try:
+                return await self.hass.loop.run_in_executor(pool, job, *args)
+            except BrokenProcessPool:
+                self._handle_broken_pool()
+        return await self.hass.async_add_executor_job(job, *args)
+
+    def _handle_broken_pool(self) -> None:
+        """Stop using worker processes after one dies."""
+        _LOGGER.warning(
+            "Vestaboard render worker died, falling back to in-process rendering"
+        )
+        self._shutdown_pool()
+        self._pool_failed = True
+
+    async def _async_get_pool(self) -> ProcessPoolExecutor | None:
+        """Return the worker pool, starting it if needed."""
+        if self._pool is None and not self._pool_failed:
+            # Concurrent first renders wait for one pool rather than each starting one
+            async with self._pool_lock:
+                if self._pool is None and not self._pool_failed:
+                    try:
+                        self._pool = await self.hass.async_add_executor_job(
+                            self._start_pool
+                        )
+                    except (OSError, RuntimeError) as ex:
+                        _LOGGER.warning(
+                            "Unable to start Vestaboard render workers: %s", ex
+                        )
+                        self._pool_failed = True
+        return self._pool
+
+    @staticmethod
+    def _start_pool() -> ProcessPoolExecutor:
+        """Start and pre-warm the worker pool."""
+        workers = min(os.cpu_count() or 1, MAX_WORKERS)
+        pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_warm_worker,
+        )
+        # Submitting a no-op for each worker spawns them now rather than on the
+        # first render, so the initializer cost is paid up front
+        for _ in range(workers):
+            pool.submit(int)
+        return pool
+
+    def _shutdown_pool(self) -> None:
+        """Shut down the worker pool without waiting."""
+        if pool := self._pool:
+            self._pool = None
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    async def _async_stop(self, event: Event) -> None:
+        """Handle Home Assistant stopping."""
+        self._shutdown_pool()
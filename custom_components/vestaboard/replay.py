@@ -0,0 +1,232 @@
+"""Replay traces of board traffic for the Vestaboard integration.
+
+Replaying a recorded trace drives a coordinator with a fake client through the
+same traffic and reports what it cost, so changes to polling, caching or
+writes can be measured against a real day of automations before upgrading::
+
+    python -m custom_components.vestaboard.replay TRACE [--speed 60]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from datetime import timedelta
+import json
+import logging
+from pathlib import Path
+import statistics
+import tempfile
+import time
+from types import MappingProxyType, SimpleNamespace
+from typing import Any
+
+import httpx
+
+from homeassistant.config_entries import SOURCE_USER, ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import device_registry as dr
+
+from .const import CONF_MODEL, DATA_RENDERER, DOMAIN, MODEL_BLACK
+from .coordinator import VestaboardCoordinator
+from .render import VestaboardRenderer
+from .trace import (
+    TRACE_CANCEL,
+    TRACE_CLEAR,
+    TRACE_PERSISTENT,
+    TRACE_READ,
+    TRACE_TEMPORARY,
+    TRACE_WRITE,
+    decode_grid,
+    load_trace,
+)
+from .vestaboard_model import VestaboardModel
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ReplayClient:
+    """Stand-in for a `LocalClient` answering from a trace."""
+
+    def __init__(self, speed: float) -> None:
+        """Initialize."""
+        self.speed = speed
+        self.rows: list[list[int]] | None = None
+        self.read_latency = 0.0
+        self.write_latency = 0.0
+        self.fail = False
+        self.writes = 0
+        # Recorded temporary message IDs to their replayed IDs
+        self.message_ids: dict[str, str] = {}
+        self.http = SimpleNamespace(base_url=httpx.URL("http://replay"))
+
+    def read_message(self) -> list[list[int]] | None:
+        """Return the grid the board reported."""
+        time.sleep(self.read_latency)
+        if self.fail:
+            raise httpx.ConnectError("Recorded read failed")
+        return self.rows
+
+    def write_message(self, rows: list[list[int]]) -> None:
+        """Accept a write."""
+        time.sleep(self.write_latency)
+        self.rows = rows
+        self.writes += 1
+
+
+@dataclass(slots=True)
+class ReplayReport:
+    """What replaying a trace cost."""
+
+    events: int = 0
+    reads: int = 0
+    writes: int = 0
+    recorded_writes: int = 0
+    renders: int = 0
+    render_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    wall_seconds: float = 0.0
+    latency_ms: dict[str, float] = field(default_factory=dict)
+
+
+class _CountingRenderer(VestaboardRenderer):
+    """Renderer counting the jobs it runs."""
+
+    renders = 0
+    render_seconds = 0.0
+
+    async def _async_run[T](
+        self, use_process: bool, job: Callable[..., T], *args: Any
+    ) -> T:
+        """Run a render job, timing it."""
+        start = time.perf_counter()
+        try:
+            return await super()._async_run(use_process, job, *args)
+        finally:
+            self.renders += 1
+            self.render_seconds += time.perf_counter() - start
+
+
+async def _async_replay_event(
+    coordinator: VestaboardCoordinator,
+    client: ReplayClient,
+    kind: str,
+    payload: dict[str, Any],
+    latency: float,
+) -> None:
+    """Drive the coordinator through a recorded event."""
+    columns = VestaboardModel.from_name(coordinator.model).columns
+    grid = decode_grid(payload.get("grid"), columns)
+    if kind == TRACE_READ:
+        client.read_latency = latency
+        client.fail = "error" in payload
+        client.rows = grid
+        await coordinator.async_refresh()
+    elif kind == TRACE_PERSISTENT:
+        await coordinator.async_set_persistent_message(grid)
+    elif kind == TRACE_TEMPORARY:
+        duration = payload["duration"] / (client.speed or 1)
+        if message := await coordinator.async_show_temporary_message(
+            grid, timedelta(seconds=duration), payload["priority"]
+        ):
+            client.message_ids[payload["id"]] = message.id
+    elif kind == TRACE_CANCEL:
+        await coordinator.async_cancel_temporary_message(
+            client.message_ids.get(payload["id"], payload["id"])
+        )
+    elif kind == TRACE_CLEAR:
+        await coordinator.async_clear_temporary_messages()
+
+
+async def async_replay(
+    path: Path, *, speed: float = 0, options: dict[str, Any] | None = None
+) -> ReplayReport:
+    """Replay a trace against a coordinator in a throwaway Home Assistant.
+
+    A speed of 0 replays as fast as possible, which skips the waits so
+    temporary messages outlive the replay. Any other speed is a multiple of
+    real time, with temporary message durations scaled to match.
+    """
+    events = await asyncio.to_thread(load_trace, path)
+    options = {CONF_MODEL: MODEL_BLACK} | (options or {})
+    report = ReplayReport(events=len(events))
+    latencies: list[float] = []
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        await dr.async_load(hass)
+        await hass.async_start()
+        renderer = _CountingRenderer(hass)
+        hass.data[DOMAIN] = {DATA_RENDERER: renderer}
+        entry = ConfigEntry(
+            data={},
+            discovery_keys=MappingProxyType({}),
+            domain=DOMAIN,
+            minor_version=1,
+            options=options,
+            source=SOURCE_USER,
+            subentries_data=None,
+            title="Replay",
+            unique_id=None,
+            version=1,
+        )
+        client = ReplayClient(speed)
+        coordinator = VestaboardCoordinator(hass, entry, client)
+        coordinator.async_setup_quiet_hours()
+        started = events[0][0] if events else 0.0
+        cpu, wall = time.process_time(), time.perf_counter()
+
+        for timestamp, kind, payload in events:
+            if speed:
+                delay = (timestamp - started) / speed - (time.perf_counter() - wall)
+                await asyncio.sleep(max(delay, 0))
+            latency = payload.get("seconds", 0) / speed if speed else 0
+            if kind == TRACE_WRITE:
+                # Replayed writes take as long as the last recorded one
+                report.recorded_writes += 1
+                client.write_latency = latency
+                continue
+            call = time.perf_counter()
+            try:
+                await _async_replay_event(coordinator, client, kind, payload, latency)
+            except HomeAssistantError as err:
+                _LOGGER.debug("Replayed %s failed: %s", kind, err)
+            latencies.append((time.perf_counter() - call) * 1000)
+            report.reads += kind == TRACE_READ
+
+        await hass.async_block_till_done()
+        report.cpu_seconds = round(time.process_time() - cpu, 3)
+        report.wall_seconds = round(time.perf_counter() - wall, 3)
+        report.writes = client.writes
+        report.renders = renderer.renders
+        report.render_seconds = round(renderer.render_seconds, 3)
+        if latencies:
+            latencies.sort()
+            report.latency_ms = {
+                "mean": round(statistics.fmean(latencies), 2),
+                "p95": round(latencies[int(len(latencies) * 0.95)], 2),
+                "max": round(latencies[-1], 2),
+            }
+        await coordinator.async_shutdown()
+        await hass.async_stop()
+    return report
+
+
+def main() -> None:
+    """Replay a trace from the command line and print the report."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("trace", type=Path)
+    parser.add_argument("--speed", type=float, default=0)
+    parser.add_argument("--options", type=json.loads, default=None)
+    args = parser.parse_args()
+    report = asyncio.run(
+        async_replay(args.trace, speed=args.speed, options=args.options)
+    )
+    print(json.dumps(asdict(report), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+"""Ahead-of-time scheduled templates for the Vestaboard integration."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import logging
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_track_point_in_time
+import homeassistant.util.dt as dt_util
+
+from .const import CONF_MESSAGE, CONF_VBML
+
+if TYPE_CHECKING:
+    from .coordinator import VestaboardCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+type Composer = Callable[[Mapping[str, Any]], Awaitable[list[list[int]]]]
+
+
+@dataclass(slots=True)
+class PrecomputedFrame:
+    """A composed and rendered frame waiting for its boundary."""
+
+    when: datetime
+    rows: list[list[int]]
+    images: dict[str, bytes]
+
+
+class ScheduledTemplate:
+    """Write a time-based template to boards at each interval boundary.
+
+    The next `lookahead` frames are composed and rendered in the background,
+    with props formatted from each boundary time using strftime, so only the
+    board write happens when a boundary is reached.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        compose: Composer,
+        data: Mapping[str, Any],
+        props: dict[str, str],
+        interval: timedelta,
+        lookahead: int,
+    ) -> None:
+        """Initialize."""
+        self.hass = hass
+        self.coordinators: list[VestaboardCoordinator] = []
+        self._compose = compose
+        self._data = data
+        self._props = props
+        self._interval = interval.total_seconds()
+        self._lookahead = lookahead
+        self._frames: deque[PrecomputedFrame] = deque()
+        self._composed: dict[tuple[str, ...], list[list[int]]] = {}
+        self._next: datetime | None = None
+        self._fill_task: asyncio.Task | None = None
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_start(self, coordinators: list[VestaboardCoordinator]) -> None:
+        """Start writing to the coordinators."""
+        for coordinator in coordinators:
+            if (previous := coordinator.scheduled_template) is not None:
+                previous.async_remove(coordinator)
+            coordinator.scheduled_template = self
+        self.coordinators = coordinators
+        self._async_fill()
+
+    @callback
+    def async_remove(self, coordinator: VestaboardCoordinator) -> None:
+        """Stop writing to a coordinator, stopping entirely if none remain."""
+        coordinator.scheduled_template = None
+        if coordinator in self.coordinators:
+            self.coordinators.remove(coordinator)
+        if not self.coordinators:
+            self.async_stop()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop writing and discard precomputed frames."""
+        for coordinator in self.coordinators:
+            coordinator.scheduled_template = None
+        self.coordinators = []
+        if self._fill_task:
+            self._fill_task.cancel()
+            self._fill_task = None
+        if self._unsub:
+            self._unsub()
+            self._unsub = None
+        self._frames.clear()
+
+    def _next_boundary(self, after: datetime) -> datetime:
+        """Return the first interval boundary after a point in time.
+
+        Boundaries are counted in wall-clock time from local midnight, so an
+        hourly template changes on the hour in any time zone and on either
+        side of a daylight saving time change.
+        """
+        after = dt_util.as_utc(after)
+        start = dt_util.start_of_local_day(dt_util.as_local(after))
+        midnight = start.replace(tzinfo=None)
+        elapsed = (
+            dt_util.as_local(after).replace(tzinfo=None) - midnight
+        ).total_seconds()
+        boundary = midnight + timedelta(
+            seconds=elapsed // self._interval * self._interval
+        )
+        while True:
+            # A repeated hour has both folds and a skipped hour moves forward,
+            # so the boundary just passed may still come again
+            for fold in (0, 1):
+                when = dt_util.as_utc(boundary.replace(tzinfo=start.tzinfo, fold=fold))
+                if when > after:
+                    return dt_util.as_local(when)
+            boundary += timedelta(seconds=self._interval)
+
+    @callback
+    def _async_fill(self) -> None:
+        """Start precomputing frames if the lookahead isn't full."""
+        if self._fill_task is None and len(self._frames) < self._lookahead:
+            self._fill_task = self.hass.async_create_background_task(
+                self._async_fill_frames(), "vestaboard scheduled template"
+            )
+
+    async def _async_fill_frames(self) -> None:
+        """Compose and render frames up to the lookahead."""
+        try:
+            while len(self._frames) < self._lookahead and self.coordinators:
+                when = self._next_boundary(self._next or dt_util.now())
+                self._next = when
+                rows = await self._async_compose(when)
+                images: dict[str, bytes] = {}
+                for coordinator in self.coordinators:
+                    if (model := coordinator.model) not in images:
+                        images[model] = await coordinator.renderer.async_render_png(
+                            rows, model, use_process=coordinator.render_process
+                        )
+                self._frames.append(PrecomputedFrame(when, rows, images))
+                if self._unsub is None:
+                    self._async_arm()
+        except (HomeAssistantError, httpx.HTTPError) as err:
+            _LOGGER.warning("Unable to compose scheduled template: %s", err)
+            if self._unsub is None:
+                # Nothing left to write, so retry from the next boundary
+                self._unsub = async_track_point_in_time(
+                    self.hass, self._async_retry, self._next
+                )
+        finally:
+            self._fill_task = None
+
+    @callback
+    def _async_retry(self, now: datetime) -> None:
+        """Retry composing after a failure."""
+        self._unsub = None
+        self._async_fill()
+
+    async def _async_compose(self, when: datetime) -> list[list[int]]:
+        """Compose the grid for a boundary, reusing grids for identical props."""
+        props = {name: when.strftime(fmt) for name, fmt in self._props.items()}
+        key = tuple(props.values())
+        if (rows := self._composed.get(key)) is None:
+            if vbml := self._data.get(CONF_VBML):
+                data = {CONF_VBML: vbml | {"props": vbml.get("props", {}) | props}}
+            else:
+                message = self._data[CONF_MESSAGE]
+                for name, value in props.items():
+                    message = message.replace(f"{{{{{name}}}}}", value)
+                data = {**self._data, CONF_MESSAGE: message}
+            rows = await self._compose(data)
+            # Only the most recent grids can repeat, so keep the memo small
+            if len(self._composed) >= self._lookahead * 2:
+                self._composed.pop(next(iter(self._composed)))
+            self._composed[key] = rows
+        return rows
+
+    @callback
+    def _async_arm(self) -> None:
+        """Arm the timer for the next precomputed frame."""
+        now = dt_util.now()
+        while self._frames and self._frames[0].when < now:
+            self._frames.popleft()
+        if self._frames:
+            self._unsub = async_track_point_in_time(
+                self.hass, self._async_write_frame, self._frames[0].when
+            )
+        self._async_fill()
+
+    async def _async_write_frame(self, now: datetime) -> None:
+        """Write the precomputed frame for this boundary to every board."""
+        self._unsub = None
+        frame = self._frames.popleft()
+        self._async_arm()
+
+        async def _async_write(coordinator: VestaboardCoordinator) -> None:
+            try:
+                await coordinator.async_set_persistent_message(
+                    frame.rows, frame.images.get(coordinator.model)
+                )
+            except HomeAssistantError as err:
+                _LOGGER.warning("Unable to write scheduled template: %s", err)
+
+        await asyncio.gather(*(_async_write(c) for c in self.coordinators))
@@ -0,0 +1,193 @@
+"""Temporary message scheduler for the Vestaboard integration."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import heapq
+import itertools
+from typing import Any, TypedDict
+from uuid import uuid4
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_time
+import homeassistant.util.dt as dt_util
+
+from .helpers import decode
+
+
+class StoredMessage(TypedDict):
+    """Stored temporary message."""
+
+    id: str
+    rows: list[list[int]]
+    priority: int
+    expiration: str
+
+
+@dataclass(slots=True)
+class ScheduledMessage:
+    """A temporary message waiting to be shown or currently shown."""
+
+    id: str
+    rows: list[list[int]]
+    priority: int
+    expiration: datetime
+    sequence: int
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON serializable representation."""
+        return {
+            "id": self.id,
+            "priority": self.priority,
+            "expiration": self.expiration.isoformat(),
+            "message": decode(self.rows),
+        }
+
+    def as_stored(self) -> StoredMessage:
+        """Return a representation for storage."""
+        return {
+            "id": self.id,
+            "rows": self.rows,
+            "priority": self.priority,
+            "expiration": self.expiration.isoformat(),
+        }
+
+
+class MessageScheduler:
+    """Stack of temporary messages for a single board.
+
+    The displayed message is the highest priority unexpired entry, with the
+    most recently added entry winning ties. Entries are kept in two heaps, one
+    ordered for display and one by expiration, and removed lazily, so only a
+    single timer for the next expiration is ever armed.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        on_change: Callable[[], Coroutine[Any, Any, None]],
+    ) -> None:
+        """Initialize."""
+        self.hass = hass
+        self._on_change = on_change
+        self._entries: dict[str, ScheduledMessage] = {}
+        self._by_priority: list[tuple[int, int, str]] = []
+        self._by_expiration: list[tuple[datetime, int, str]] = []
+        self._sequence = itertools.count()
+        self._unsub: CALLBACK_TYPE | None = None
+        self._armed_at: datetime | None = None
+
+    def __len__(self) -> int:
+        """Return the number of pending messages."""
+        return len(self._entries)
+
+    @property
+    def current(self) -> ScheduledMessage | None:
+        """Return the message that should be displayed."""
+        while self._by_priority:
+            if entry := self._entries.get(self._by_priority[0][2]):
+                return entry
+            heapq.heappop(self._by_priority)
+        return None
+
+    def entries(self) -> list[ScheduledMessage]:
+        """Return pending messages in display order."""
+        return sorted(self._entries.values(), key=lambda e: (-e.priority, -e.sequence))
+
+    @callback
+    def async_add(
+        self, rows: list[list[int]], duration: timedelta, priority: int = 0
+    ) -> ScheduledMessage:
+        """Add a temporary message."""
+        return self._async_push(uuid4().hex, rows, priority, dt_util.now() + duration)
+
+    @callback
+    def async_restore(self, stored: list[StoredMessage]) -> None:
+        """Restore stored messages that haven't expired, keeping their order."""
+        now = dt_util.now()
+        for message in stored:
+            expiration = dt_util.parse_datetime(message["expiration"])
+            if expiration and expiration > now:
+                self._async_push(
+                    message["id"], message["rows"], message["priority"], expiration
+                )
+
+    def as_stored(self) -> list[StoredMessage]:
+        """Return pending messages for storage, oldest first."""
+        return [
+            entry.as_stored()
+            for entry in sorted(self._entries.values(), key=lambda e: e.sequence)
+        ]
+
+    @callback
+    def _async_push(
+        self,
+        message_id: str,
+        rows: list[list[int]],
+        priority: int,
+        expiration: datetime,
+    ) -> ScheduledMessage:
+        """Add a message to the heaps and re-arm the timer."""
+        entry = ScheduledMessage(
+            id=message_id,
+            rows=rows,
+            priority=priority,
+            expiration=expiration,
+            sequence=next(self._sequence),
+        )
+        self._entries[entry.id] = entry
+        heapq.heappush(self._by_priority, (-priority, -entry.sequence, entry.id))
+        heapq.heappush(
+            self._by_expiration, (entry.expiration, entry.sequence, entry.id)
+        )
+        self._async_arm()
+        return entry
+
+    @callback
+    def async_cancel(self, message_id: str) -> bool:
+        """Cancel a temporary message, returning True if it was pending."""
+        if self._entries.pop(message_id, None) is None:
+            return False
+        self._async_arm()
+        return True
+
+    @callback
+    def async_clear(self) -> None:
+        """Cancel all temporary messages."""
+        self._entries.clear()
+        self._by_priority.clear()
+        self._by_expiration.clear()
+        self._async_arm()
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel the expiration timer."""
+        if self._unsub:
+            self._unsub()
+            self._unsub = None
+        self._armed_at = None
+
+    @callback
+    def _async_arm(self) -> None:
+        """Arm the timer for the next expiration, if it changed."""
+        while self._by_expiration and self._by_expiration[0][2] not in self._entries:
+            heapq.heappop(self._by_expiration)
+        next_expiration = self._by_expiration[0][0] if self._by_expiration else None
+        if next_expiration == self._armed_at:
+            return
+        self.async_stop()
+        if next_expiration:
+            self._armed_at = next_expiration
+            self._unsub = async_track_point_in_time(
+                self.hass, self._async_handle_expiration, next_expiration
+            )
+
+    async def _async_handle_expiration(self, now: datetime) -> None:
+        """Drop expired messages and re-arm the timer."""
+        self._unsub = self._armed_at = None
+        while self._by_expiration and self._by_expiration[0][0] <= now:
+            self._entries.pop(heapq.heappop(self._by_expiration)[2], None)
+        self._async_arm()
+        await self._on_change()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import base64
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Callable, Mapping
@@ -15,8 +16,10 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .const import CONF_RECORD_CHARACTER_CODES
 from .coordinator import VestaboardConfigEntry, VestaboardCoordinator
 from .entity import VestaboardEntity
+from .render import pack_grid
 
 
 async def async_setup_entry(
@@ -25,8 +28,16 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Vestaboard sensors using config entry."""
+    message_entity = (
+        VestaboardSensorEntity
+        if entry.options.get(CONF_RECORD_CHARACTER_CODES, True)
+        else VestaboardUnrecordedSensorEntity
+    )
     async_add_entities(
-        VestaboardSensorEntity(entry, description) for description in SENSORS
+        (message_entity if description.key == "message" else VestaboardSensorEntity)(
+            entry, description
+        )
+        for description in SENSORS
     )
 
 
@@ -61,10 +72,26 @@ class VestaboardSensorEntity(VestaboardEntity, SensorEntity):
         """Return the value reported by the sensor."""
         return self.entity_description.value_fn(self.coordinator)
 
+    def _state_dependency(self) -> Any:
+        """Return the coordinator state this entity's state is derived from."""
+        if self.entity_description.key == "message":
+            # Character codes are attributes, so the grid rather than the text
+            return self.coordinator.data
+        return self.native_value
+
     @property
     def extra_state_attributes(self) -> Mapping[str, Any] | None:
         """Return entity specific state attributes."""
         if self.entity_description.key == "message" and (data := self.coordinator.data):
+            if self.coordinator.compact_attributes:
+                # One byte per tile, less than half the size of character_codes
+                return {"character_grid": base64.b64encode(pack_grid(data)).decode()}
             character_codes = "".join(f"{{{code}}}" for row in data for code in row)
             return {"character_codes": character_codes}
         return None
+
+
+class VestaboardUnrecordedSensorEntity(VestaboardSensorEntity):
+    """Vestaboard sensor entity that keeps character codes out of the recorder."""
+
+    _unrecorded_attributes = frozenset({"character_codes", "character_grid"})
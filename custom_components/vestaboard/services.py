@@ -2,31 +2,90 @@
 
 from __future__ import annotations
 
+import asyncio
+import base64
+from collections.abc import Mapping
 from datetime import timedelta
+from functools import partial
+from pathlib import Path
+from typing import Any
 
 import voluptuous as vol
 
-from homeassistant.const import CONF_DEVICE_ID
-from homeassistant.core import HomeAssistant, HomeAssistantError, ServiceCall, callback
+from homeassistant.components import camera
+from homeassistant.components.media_player import (
+    DATA_COMPONENT as MEDIA_PLAYER_DATA_COMPONENT,
+    DOMAIN as MEDIA_PLAYER_DOMAIN,
+)
+from homeassistant.const import CONF_DEVICE_ID, CONF_NAME, CONF_PATH
+from homeassistant.core import (
+    HomeAssistant,
+    HomeAssistantError,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
 from homeassistant.helpers import config_validation as cv
-from homeassistant.helpers.event import async_track_point_in_time
 from homeassistant.helpers.httpx_client import get_async_client
-from homeassistant.util.dt import now as dt_now
 
+from .compiled import CompiledMessage, CompiledMessages, compiled_handle
 from .const import (
     ALIGN_CENTER,
     ALIGN_HORIZONTAL,
     ALIGN_VERTICAL,
     CONF_ALIGN,
+    CONF_BOARDS,
+    CONF_CAMERA,
+    CONF_COLUMNS,
+    CONF_DITHER,
     CONF_DURATION,
+    CONF_DWELL,
+    CONF_HANDLE,
+    CONF_HEIGHT,
+    CONF_INTERVAL,
+    CONF_ITEMS,
     CONF_JUSTIFY,
+    CONF_LOOKAHEAD,
+    CONF_MEDIA_PLAYER,
     CONF_MESSAGE,
+    CONF_MESSAGE_ID,
+    CONF_MODEL,
+    CONF_PRIORITY,
+    CONF_PROPS,
+    CONF_ROWS,
     CONF_VBML,
+    DATA_COMPILED,
+    DATA_RENDERER,
+    DATA_TILE_ART,
     DOMAIN,
+    MODEL_BLACK,
+    SERVICE_CANCEL_MESSAGE,
+    SERVICE_CANCEL_TEMPLATE,
+    SERVICE_COMPILE,
+    SERVICE_DELETE_PLAYLIST,
+    SERVICE_LIST_MESSAGES,
     SERVICE_MESSAGE,
+    SERVICE_MESSAGE_BATCH,
+    SERVICE_RENDER,
+    SERVICE_SCHEDULE_TEMPLATE,
+    SERVICE_SET_PLAYLIST,
+    SERVICE_SHOW_IMAGE,
+    SERVICE_START_PLAYLIST,
+    SERVICE_STOP_PLAYLIST,
     VBML_URL,
 )
-from .helpers import async_get_coordinator_by_device_id, construct_message
+from .coordinator import VestaboardCoordinator
+from .helpers import (
+    async_get_coordinator_by_device_id,
+    async_get_entry_by_device_id,
+    construct_message,
+)
+from .playlist import StoredFrame
+from .render import VestaboardRenderer
+from .scheduled_template import ScheduledTemplate
+from .tile_art import TileArtConverter
+from .vestaboard_model import VestaboardModel
 
 _character_codes = vol.All(vol.Coerce(int), vol.Range(min=0, max=71))
 _raw_characters = vol.All(cv.ensure_list, [vol.All(cv.ensure_list, [_character_codes])])
@@ -62,6 +121,23 @@ VBML_SCHEMA = vol.Schema(
     }
 )
 
+_temporary = {
+    vol.Optional(CONF_DURATION): vol.All(vol.Coerce(int), vol.Range(min=10, max=7200)),
+    vol.Optional(CONF_PRIORITY, default=0): vol.All(
+        vol.Coerce(int), vol.Range(min=0, max=100)
+    ),
+}
+
+
+def _handle_alone(data: dict[str, Any]) -> dict[str, Any]:
+    """Validate that a compiled handle isn't sent with a message or VBML."""
+    if CONF_HANDLE in data and (CONF_MESSAGE in data or CONF_VBML in data):
+        raise vol.Invalid(
+            f"{CONF_HANDLE} can't be used with {CONF_MESSAGE} or {CONF_VBML}"
+        )
+    return data
+
+
 SERVICE_MESSAGE_SCHEMA = vol.All(
     vol.Schema(
         {
@@ -70,13 +146,224 @@ SERVICE_MESSAGE_SCHEMA = vol.All(
             vol.Optional(CONF_JUSTIFY, default=ALIGN_CENTER): vol.In(ALIGN_HORIZONTAL),
             vol.Optional(CONF_ALIGN, default=ALIGN_CENTER): vol.In(ALIGN_VERTICAL),
             vol.Optional(CONF_VBML): VBML_SCHEMA,
-            vol.Optional(CONF_DURATION): vol.All(
-                vol.Coerce(int), vol.Range(min=10, max=7200)
-            ),
+            vol.Optional(CONF_HANDLE): cv.string,
+            **_temporary,
         },
     ),
+    cv.has_at_least_one_key(CONF_MESSAGE, CONF_VBML, CONF_HANDLE),
+    _handle_alone,
+)
+SERVICE_LIST_MESSAGES_SCHEMA = vol.Schema(
+    {vol.Required(CONF_DEVICE_ID): vol.All(cv.ensure_list, [cv.string])}
+)
+SERVICE_CANCEL_MESSAGE_SCHEMA = SERVICE_LIST_MESSAGES_SCHEMA.extend(
+    {vol.Optional(CONF_MESSAGE_ID): cv.string}
+)
+SERVICE_STOP_PLAYLIST_SCHEMA = SERVICE_LIST_MESSAGES_SCHEMA
+SERVICE_START_PLAYLIST_SCHEMA = SERVICE_LIST_MESSAGES_SCHEMA.extend(
+    {vol.Required(CONF_NAME): cv.string}
+)
+SERVICE_DELETE_PLAYLIST_SCHEMA = SERVICE_START_PLAYLIST_SCHEMA
+_item = vol.Schema(
+    {
+        vol.Optional(CONF_MESSAGE): cv.string,
+        vol.Optional(CONF_JUSTIFY, default=ALIGN_CENTER): vol.In(ALIGN_HORIZONTAL),
+        vol.Optional(CONF_ALIGN, default=ALIGN_CENTER): vol.In(ALIGN_VERTICAL),
+        vol.Optional(CONF_VBML): VBML_SCHEMA,
+        vol.Optional(CONF_ROWS): _raw_characters,
+    }
+)
+_playlist_item = vol.All(
+    _item.extend(
+        {
+            vol.Required(CONF_DWELL): vol.All(
+                vol.Coerce(int), vol.Range(min=10, max=86400)
+            ),
+        }
+    ),
+    cv.has_at_least_one_key(CONF_MESSAGE, CONF_VBML, CONF_ROWS),
+)
+_render_item = vol.All(
+    _item, cv.has_at_least_one_key(CONF_MESSAGE, CONF_VBML, CONF_ROWS)
+)
+_batch_item = vol.All(
+    _item.extend({vol.Required(CONF_DEVICE_ID): cv.string, **_temporary}),
+    cv.has_at_least_one_key(CONF_MESSAGE, CONF_VBML, CONF_ROWS),
+)
+
+
+def _one_message_per_device(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Validate that a batch sends at most one message to each device."""
+    device_ids = [item[CONF_DEVICE_ID] for item in items]
+    if len(set(device_ids)) != len(device_ids):
+        raise vol.Invalid("Each device can only be sent one message per batch")
+    return items
+
+
+SERVICE_MESSAGE_BATCH_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_ITEMS): vol.All(
+            cv.ensure_list,
+            [_batch_item],
+            vol.Length(min=1, max=100),
+            _one_message_per_device,
+        )
+    }
+)
+SERVICE_COMPILE_SCHEMA = vol.All(
+    _item.extend(
+        {
+            vol.Optional(CONF_DEVICE_ID): cv.string,
+            vol.Optional(CONF_MODEL): vol.In(VestaboardModel.all_models()),
+        }
+    ),
+    cv.has_at_least_one_key(CONF_MESSAGE, CONF_VBML, CONF_ROWS),
+)
+SERVICE_SET_PLAYLIST_SCHEMA = SERVICE_START_PLAYLIST_SCHEMA.extend(
+    {vol.Required(CONF_ITEMS): vol.All(cv.ensure_list, [_playlist_item])}
+)
+SERVICE_SCHEDULE_TEMPLATE_SCHEMA = vol.All(
+    SERVICE_LIST_MESSAGES_SCHEMA.extend(
+        {
+            vol.Optional(CONF_MESSAGE): cv.string,
+            vol.Optional(CONF_JUSTIFY, default=ALIGN_CENTER): vol.In(ALIGN_HORIZONTAL),
+            vol.Optional(CONF_ALIGN, default=ALIGN_CENTER): vol.In(ALIGN_VERTICAL),
+            vol.Optional(CONF_VBML): VBML_SCHEMA,
+            vol.Required(CONF_PROPS): {cv.string: cv.string},
+            vol.Optional(CONF_INTERVAL, default=60): vol.All(
+                vol.Coerce(int), vol.Range(min=10, max=86400)
+            ),
+            vol.Optional(CONF_LOOKAHEAD, default=5): vol.All(
+                vol.Coerce(int), vol.Range(min=1, max=60)
+            ),
+        }
+    ),
     cv.has_at_least_one_key(CONF_MESSAGE, CONF_VBML),
 )
+SERVICE_CANCEL_TEMPLATE_SCHEMA = SERVICE_LIST_MESSAGES_SCHEMA
+SERVICE_SHOW_IMAGE_SCHEMA = vol.All(
+    SERVICE_LIST_MESSAGES_SCHEMA.extend(
+        {
+            vol.Exclusive(CONF_PATH, "source"): cv.string,
+            vol.Exclusive(CONF_CAMERA, "source"): cv.entity_domain(camera.DOMAIN),
+            vol.Exclusive(CONF_MEDIA_PLAYER, "source"): cv.entity_domain(
+                MEDIA_PLAYER_DOMAIN
+            ),
+            vol.Optional(CONF_DITHER, default=False): cv.boolean,
+            **_temporary,
+        }
+    ),
+    cv.has_at_least_one_key(CONF_PATH, CONF_CAMERA, CONF_MEDIA_PLAYER),
+)
+SERVICE_RENDER_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional(CONF_DEVICE_ID): cv.string,
+            vol.Optional(CONF_NAME): cv.string,
+            vol.Optional(CONF_ITEMS): vol.All(
+                cv.ensure_list, [_render_item], vol.Length(max=100)
+            ),
+            vol.Optional(CONF_MODEL): vol.In(VestaboardModel.all_models()),
+            vol.Optional(CONF_HEIGHT, default=270): vol.All(
+                vol.Coerce(int), vol.Range(min=50, max=1080)
+            ),
+            vol.Optional(CONF_COLUMNS): vol.All(
+                vol.Coerce(int), vol.Range(min=1, max=20)
+            ),
+        }
+    ),
+    cv.has_at_least_one_key(CONF_ITEMS, CONF_NAME),
+    cv.has_at_least_one_key(CONF_ITEMS, CONF_DEVICE_ID),
+)
+
+
+async def _translate_vbml(hass: HomeAssistant, vbml: dict) -> list[list[int]]:
+    """Translate VBML."""
+    client = get_async_client(hass)
+    response = await client.post(VBML_URL, json=vbml)
+    if response.is_error and b"message" in response.content:
+        raise HomeAssistantError(response.json())
+    response.raise_for_status()
+    return response.json()
+
+
+async def async_compose_message(
+    hass: HomeAssistant, data: Mapping[str, Any]
+) -> list[list[int]]:
+    """Compose the character rows for raw rows, VBML or a text message."""
+    if rows := data.get(CONF_ROWS):
+        return rows
+    if vbml := data.get(CONF_VBML):
+        return await _translate_vbml(hass, vbml)
+    try:
+        return construct_message(**{CONF_MESSAGE: ""} | dict(data))
+    except ValueError:
+        align = data.get(CONF_ALIGN, ALIGN_CENTER)
+        justify = data.get(CONF_JUSTIFY, ALIGN_CENTER)
+        message = {
+            "style": {CONF_ALIGN: align, CONF_JUSTIFY: justify},
+            "template": data.get(CONF_MESSAGE, ""),
+        }
+        components = [message]
+
+        vbml = {"components": components}
+        return await _translate_vbml(hass, vbml)
+
+
+def _read_image_file(hass: HomeAssistant, path: str) -> bytes:
+    """Read an image from a file Home Assistant is allowed to access."""
+    if not hass.config.is_allowed_path(path):
+        raise HomeAssistantError(f"Access to {path} is not allowed")
+    try:
+        return Path(path).read_bytes()
+    except OSError as err:
+        raise HomeAssistantError(f"Unable to read {path}: {err}") from err
+
+
+async def _async_fetch_image(hass: HomeAssistant, data: Mapping[str, Any]) -> bytes:
+    """Fetch an image from a file, a camera snapshot or a media player's art."""
+    if path := data.get(CONF_PATH):
+        return await hass.async_add_executor_job(_read_image_file, hass, path)
+    if entity_id := data.get(CONF_CAMERA):
+        return (await camera.async_get_image(hass, entity_id)).content
+    entity_id = data[CONF_MEDIA_PLAYER]
+    component = hass.data.get(MEDIA_PLAYER_DATA_COMPONENT)
+    if component is None or (player := component.get_entity(entity_id)) is None:
+        raise HomeAssistantError(f"Unknown media player: {entity_id}")
+    image, _ = await player.async_get_media_image()
+    if image is None:
+        raise HomeAssistantError(f"{entity_id} has no media image")
+    return image
+
+
+def _payload_key(item: Mapping[str, Any]) -> str:
+    """Return a key identifying what a message item displays."""
+    return repr(
+        {
+            key: value
+            for key, value in item.items()
+            if key not in (CONF_DEVICE_ID, CONF_DURATION, CONF_PRIORITY, CONF_MODEL)
+        }
+    )
+
+
+async def async_show_message(
+    coordinator: VestaboardCoordinator,
+    rows: list[list[int]],
+    data: Mapping[str, Any],
+    image: bytes | None = None,
+) -> str | None:
+    """Show a composed message, returning the ID of a temporary message."""
+    if duration := data.get(CONF_DURATION):  # Temporary message
+        message = await coordinator.async_show_temporary_message(
+            rows, timedelta(seconds=duration), data.get(CONF_PRIORITY, 0), image
+        )
+        return message.id if message else None
+    coordinator.playlists.async_stop()
+    if template := coordinator.scheduled_template:
+        template.async_remove(coordinator)
+    await coordinator.async_set_persistent_message(rows, image)
+    return None
 
 
 @callback
@@ -85,52 +372,249 @@ def async_setup_services(hass: HomeAssistant) -> None:
 
     async def _async_service_message(call: ServiceCall) -> None:
         """Send a message to a Vestaboard."""
+        rows: list[list[int]] | None = None
+        compiled: CompiledMessage | None = None
+        if handle := call.data.get(CONF_HANDLE):
+            compiled_messages: CompiledMessages = hass.data[DOMAIN][DATA_COMPILED]
+            if (compiled := compiled_messages.get(handle)) is None:
+                raise HomeAssistantError(
+                    f"Unknown or expired compiled message: {handle}"
+                )
+            rows = compiled.rows
 
-        async def _translate_vbml(vbml: dict) -> list[list[int]]:
-            """Translate VBML."""
-            client = get_async_client(hass)
-            response = await client.post(VBML_URL, json=vbml)
-            if response.is_error and b"message" in response.content:
-                raise HomeAssistantError(response.json())
-            response.raise_for_status()
-            return response.json()
-
-        if vbml := call.data.get(CONF_VBML):
-            rows = await _translate_vbml(vbml)
-        else:
+        errors: list[str] = []
+        for device_id in call.data[CONF_DEVICE_ID]:
+            entry = async_get_entry_by_device_id(hass, device_id)
+            if CONF_BOARDS in entry.data:  # Laid out across the whole wall instead
+                if compiled:
+                    errors.append("Compiled messages can only be sent to single boards")
+                    continue
+                try:
+                    await entry.runtime_data.async_show_message(call.data)
+                except HomeAssistantError as err:
+                    errors.append(str(err))
+                continue
+            if rows is None:
+                rows = await async_compose_message(hass, call.data)
+            coordinator: VestaboardCoordinator = entry.runtime_data
+            if compiled and compiled.model != coordinator.model:
+                # Models differ in size, so the rows wouldn't fit
+                errors.append(
+                    f"Vestaboard at {coordinator.host} is a {coordinator.model} "
+                    f"board, but the message was compiled for {compiled.model}"
+                )
+                continue
             try:
-                rows = construct_message(**{CONF_MESSAGE: ""} | call.data)
-            except ValueError:
-                align = call.data.get(CONF_ALIGN, ALIGN_CENTER)
-                justify = call.data.get(CONF_JUSTIFY, ALIGN_CENTER)
-                message = {
-                    "style": {CONF_ALIGN: align, CONF_JUSTIFY: justify},
-                    "template": call.data.get(CONF_MESSAGE, ""),
+                await async_show_message(
+                    coordinator, rows, call.data, compiled.image if compiled else None
+                )
+            except HomeAssistantError as err:
+                # Keep going so one unreachable board doesn't block the others
+                errors.append(str(err))
+
+        if errors:
+            raise HomeAssistantError("; ".join(errors))
+
+    async def _async_service_message_batch(call: ServiceCall) -> ServiceResponse:
+        """Send a different message to each of many Vestaboards at once."""
+        items: list[dict[str, Any]] = call.data[CONF_ITEMS]
+        # Shared so each distinct message is composed once, however many
+        # boards it is sent to
+        composed: dict[str, asyncio.Task[list[list[int]]]] = {}
+
+        async def _async_send(item: dict[str, Any]) -> str | None:
+            entry = async_get_entry_by_device_id(hass, item[CONF_DEVICE_ID])
+            if CONF_BOARDS in entry.data:  # Laid out across the whole wall instead
+                if item.get(CONF_ROWS):
+                    raise HomeAssistantError("Rows can only be sent to single boards")
+                await entry.runtime_data.async_show_message(item)
+                return None
+            if (task := composed.get(key := _payload_key(item))) is None:
+                task = composed[key] = hass.async_create_task(
+                    async_compose_message(hass, item), eager_start=True
+                )
+            return await async_show_message(entry.runtime_data, await task, item)
+
+        results = await asyncio.gather(
+            *(_async_send(item) for item in items),
+            return_exceptions=True,
+        )
+        response: dict[str, Any] = {}
+        errors: list[str] = []
+        for item, result in zip(items, results):
+            if isinstance(result, Exception):
+                errors.append(str(result))
+                response[item[CONF_DEVICE_ID]] = {
+                    "success": False,
+                    "error": str(result),
                 }
-                components = [message]
+            else:
+                response[item[CONF_DEVICE_ID]] = {"success": True, "message_id": result}
 
-                vbml = {"components": components}
-                rows = await _translate_vbml(vbml)
+        if not call.return_response:
+            if errors:
+                raise HomeAssistantError("; ".join(errors))
+            return None
+        return response
 
+    async def _async_service_compile(call: ServiceCall) -> ServiceResponse:
+        """Compose and render a message for sending later, without sending it."""
+        coordinator = None
+        if device_id := call.data.get(CONF_DEVICE_ID):
+            coordinator = async_get_coordinator_by_device_id(hass, device_id)
+        model = call.data.get(CONF_MODEL) or (
+            coordinator.model if coordinator else MODEL_BLACK
+        )
+        compiled_messages: CompiledMessages = hass.data[DOMAIN][DATA_COMPILED]
+        handle = compiled_handle(_payload_key(call.data), model)
+        if (compiled := compiled_messages.get(handle)) is None:
+            rows = await async_compose_message(hass, call.data)
+            renderer: VestaboardRenderer = hass.data[DOMAIN][DATA_RENDERER]
+            image = await renderer.async_render_png(
+                rows,
+                model,
+                use_process=bool(coordinator and coordinator.render_process),
+            )
+            compiled = CompiledMessage(handle, rows, model, image)
+            compiled_messages.add(compiled)
+        return compiled.as_dict()
+
+    async def _async_service_list_messages(call: ServiceCall) -> ServiceResponse:
+        """List the temporary messages queued on Vestaboards."""
+        return {
+            device_id: [
+                entry.as_dict()
+                for entry in async_get_coordinator_by_device_id(
+                    hass, device_id
+                ).scheduler.entries()
+            ]
+            for device_id in call.data[CONF_DEVICE_ID]
+        }
+
+    async def _async_service_cancel_message(call: ServiceCall) -> None:
+        """Cancel one or all temporary messages on Vestaboards."""
+        message_id = call.data.get(CONF_MESSAGE_ID)
         for device_id in call.data[CONF_DEVICE_ID]:
             coordinator = async_get_coordinator_by_device_id(hass, device_id)
-            if coordinator.quiet_hours():
-                continue
+            if message_id:
+                await coordinator.async_cancel_temporary_message(message_id)
+            else:
+                await coordinator.async_clear_temporary_messages()
+
+    async def _async_service_set_playlist(call: ServiceCall) -> None:
+        """Compile and store a playlist on Vestaboards."""
+        compiled: dict[str, list[list[int]]] = {}
+        frames: list[StoredFrame] = []
+        for item in call.data[CONF_ITEMS]:
+            key = repr({k: v for k, v in item.items() if k != CONF_DWELL})
+            if key not in compiled:
+                compiled[key] = await async_compose_message(hass, item)
+            frames.append({"rows": compiled[key], "dwell": item[CONF_DWELL]})
+
+        for device_id in call.data[CONF_DEVICE_ID]:
+            coordinator = async_get_coordinator_by_device_id(hass, device_id)
+            await coordinator.playlists.async_set(call.data[CONF_NAME], frames)
 
-            if duration := call.data.get(CONF_DURATION):  # This is a temporary message
-                if coordinator._cancel_cb:
-                    coordinator._cancel_cb()
-                expiration = dt_now() + timedelta(seconds=duration)
-                coordinator.temporary_message_expiration = expiration
-                await coordinator.write_and_update_state(rows)
-                coordinator._cancel_cb = async_track_point_in_time(
-                    hass, coordinator._handle_temporary_message_expiration, expiration
+    async def _async_service_start_playlist(call: ServiceCall) -> None:
+        """Start rotating through a playlist on Vestaboards."""
+        for device_id in call.data[CONF_DEVICE_ID]:
+            coordinator = async_get_coordinator_by_device_id(hass, device_id)
+            if template := coordinator.scheduled_template:
+                template.async_remove(coordinator)
+            await coordinator.playlists.async_start(call.data[CONF_NAME])
+
+    async def _async_service_stop_playlist(call: ServiceCall) -> None:
+        """Stop the playlist on Vestaboards."""
+        for device_id in call.data[CONF_DEVICE_ID]:
+            async_get_coordinator_by_device_id(hass, device_id).playlists.async_stop()
+
+    async def _async_service_delete_playlist(call: ServiceCall) -> None:
+        """Delete a playlist from Vestaboards."""
+        for device_id in call.data[CONF_DEVICE_ID]:
+            coordinator = async_get_coordinator_by_device_id(hass, device_id)
+            await coordinator.playlists.async_delete(call.data[CONF_NAME])
+
+    async def _async_service_schedule_template(call: ServiceCall) -> None:
+        """Write a time-based template to Vestaboards at each interval boundary."""
+        coordinators = [
+            async_get_coordinator_by_device_id(hass, device_id)
+            for device_id in call.data[CONF_DEVICE_ID]
+        ]
+        for coordinator in coordinators:
+            coordinator.playlists.async_stop()
+        template = ScheduledTemplate(
+            hass,
+            partial(async_compose_message, hass),
+            call.data,
+            call.data[CONF_PROPS],
+            timedelta(seconds=call.data[CONF_INTERVAL]),
+            call.data[CONF_LOOKAHEAD],
+        )
+        template.async_start(coordinators)
+
+    async def _async_service_cancel_template(call: ServiceCall) -> None:
+        """Stop writing a scheduled template to Vestaboards."""
+        for device_id in call.data[CONF_DEVICE_ID]:
+            coordinator = async_get_coordinator_by_device_id(hass, device_id)
+            if template := coordinator.scheduled_template:
+                template.async_remove(coordinator)
+
+    async def _async_service_show_image(call: ServiceCall) -> None:
+        """Show an image as colored tiles on Vestaboards."""
+        image = await _async_fetch_image(hass, call.data)
+        tile_art: TileArtConverter = hass.data[DOMAIN][DATA_TILE_ART]
+        errors: list[str] = []
+        for device_id in call.data[CONF_DEVICE_ID]:
+            coordinator = async_get_coordinator_by_device_id(hass, device_id)
+            try:
+                rows = await tile_art.async_convert(
+                    image, coordinator.model, call.data[CONF_DITHER]
                 )
-            else:
-                coordinator.persistent_message = rows
-                expiration = coordinator.temporary_message_expiration
-                if not (expiration and expiration > dt_now()):
-                    await coordinator.write_and_update_state(rows)
+            except OSError as err:
+                raise HomeAssistantError(f"Unable to read image: {err}") from err
+            try:
+                await async_show_message(coordinator, rows, call.data)
+            except HomeAssistantError as err:
+                errors.append(str(err))
+
+        if errors:
+            raise HomeAssistantError("; ".join(errors))
+
+    async def _async_service_render(call: ServiceCall) -> ServiceResponse:
+        """Render playlist frames or messages to images in a single batch."""
+        coordinator = None
+        grids: list[list[list[int]]] = []
+        if device_id := call.data.get(CONF_DEVICE_ID):
+            coordinator = async_get_coordinator_by_device_id(hass, device_id)
+        if name := call.data.get(CONF_NAME):
+            if coordinator is None or name not in coordinator.playlists.playlists:
+                raise HomeAssistantError(f"Unknown playlist: {name}")
+            grids.extend(
+                frame["rows"] for frame in coordinator.playlists.playlists[name]
+            )
+        compiled: dict[str, list[list[int]]] = {}
+        for item in call.data.get(CONF_ITEMS, []):
+            if (key := repr(item)) not in compiled:
+                compiled[key] = await async_compose_message(hass, item)
+            grids.append(compiled[key])
+        if not grids:
+            raise HomeAssistantError("Nothing to render")
+
+        model = call.data.get(CONF_MODEL) or (
+            coordinator.model if coordinator else MODEL_BLACK
+        )
+        columns = call.data.get(CONF_COLUMNS)
+        renderer: VestaboardRenderer = hass.data[DOMAIN][DATA_RENDERER]
+        images = await renderer.async_render_batch(
+            grids,
+            model,
+            call.data[CONF_HEIGHT],
+            columns=columns,
+            use_process=bool(coordinator and coordinator.render_process),
+        )
+        if columns:
+            return {"image": base64.b64encode(images).decode()}
+        return {"images": [base64.b64encode(image).decode() for image in images]}
 
     hass.services.async_register(
         DOMAIN,
@@ -138,3 +622,79 @@ def async_setup_services(hass: HomeAssistant) -> None:
         _async_service_message,
         schema=SERVICE_MESSAGE_SCHEMA,
     )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_MESSAGE_BATCH,
+        _async_service_message_batch,
+        schema=SERVICE_MESSAGE_BATCH_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_LIST_MESSAGES,
+        _async_service_list_messages,
+        schema=SERVICE_LIST_MESSAGES_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_CANCEL_MESSAGE,
+        _async_service_cancel_message,
+        schema=SERVICE_CANCEL_MESSAGE_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_COMPILE,
+        _async_service_compile,
+        schema=SERVICE_COMPILE_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_RENDER,
+        _async_service_render,
+        schema=SERVICE_RENDER_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SHOW_IMAGE,
+        _async_service_show_image,
+        schema=SERVICE_SHOW_IMAGE_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_PLAYLIST,
+        _async_service_set_playlist,
+        schema=SERVICE_SET_PLAYLIST_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_START_PLAYLIST,
+        _async_service_start_playlist,
+        schema=SERVICE_START_PLAYLIST_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_STOP_PLAYLIST,
+        _async_service_stop_playlist,
+        schema=SERVICE_STOP_PLAYLIST_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_DELETE_PLAYLIST,
+        _async_service_delete_playlist,
+        schema=SERVICE_DELETE_PLAYLIST_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SCHEDULE_TEMPLATE,
+        _async_service_schedule_template,
+        schema=SERVICE_SCHEDULE_TEMPLATE_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_CANCEL_TEMPLATE,
+        _async_service_cancel_template,
+        schema=SERVICE_CANCEL_TEMPLATE_SCHEMA,
+    )
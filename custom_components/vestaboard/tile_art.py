@@ -0,0 +1,110 @@
+"""Convert images to colored tiles for the Vestaboard integration."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from functools import lru_cache
+import hashlib
+import io
+from typing import Final
+
+import numpy as np
+from PIL import Image, ImageColor
+
+from homeassistant.core import HomeAssistant
+
+from .layout import COLOR_CODES, get_layout
+from .render import DEFAULT_HEIGHT
+from .vestaboard_model import VestaboardModel
+
+MAX_CONVERTED: Final = 32
+# How far ordered dithering nudges a tile's color, in RGB units
+DITHER_SPREAD: Final = 64
+# Differences in green are the most visible and in blue the least
+CHANNEL_WEIGHTS: Final = np.array([2, 4, 3], dtype=np.float32)
+# Ordered dithering thresholds, repeated across the board
+BAYER: Final = np.array(
+    [[0, 8, 2, 10], [12, 4, 14, 6], [3, 11, 1, 9], [15, 7, 13, 5]], dtype=np.float32
+)
+
+
+@lru_cache(maxsize=8)
+def _get_palette(color: str) -> tuple[np.ndarray, np.ndarray]:
+    """Return the color codes of a model and their RGB values.
+
+    Codes showing the same color as a lower code are left out, so blank is
+    preferred over black and white over filled.
+    """
+    model = VestaboardModel.from_name(color)
+    palette: dict[tuple[int, ...], int] = {}
+    for code in sorted(COLOR_CODES):
+        palette.setdefault(ImageColor.getrgb(model.color_map[code])[:3], code)
+    return np.array(list(palette.values())), np.array(list(palette), np.float32)
+
+
+@lru_cache(maxsize=8)
+def _get_aspect_ratio(color: str) -> float:
+    """Return the aspect ratio of the area a model's tiles cover."""
+    tiles = get_layout(color, DEFAULT_HEIGHT).tiles
+    column_pitch = tiles[0][1].center[0] - tiles[0][0].center[0]
+    row_pitch = tiles[1][0].center[1] - tiles[0][0].center[1]
+    return len(tiles[0]) * column_pitch / (len(tiles) * row_pitch)
+
+
+def image_to_grid(image: bytes, color: str, dither: bool = False) -> list[list[int]]:
+    """Convert an image to a grid of the nearest color codes of a model.
+
+    The image is cropped to the shape of the board and each tile takes the
+    average color of the area it covers.
+    """
+    model = VestaboardModel.from_name(color)
+    rows, columns = model.rows, model.columns
+    with Image.open(io.BytesIO(image)) as img:
+        # JPEGs can be decoded at a fraction of their size, which is plenty
+        img.draft("RGB", (columns * 8, rows * 8))
+        width, height = img.size
+        aspect_ratio = _get_aspect_ratio(color)
+        if width / height > aspect_ratio:
+            crop = (width - height * aspect_ratio) / 2
+            box = (crop, 0, width - crop, height)
+        else:
+            crop = (height - width / aspect_ratio) / 2
+            box = (0, crop, width, height - crop)
+        tiles = img.convert("RGB").resize(
+            (columns, rows), Image.Resampling.BOX, box=box
+        )
+    pixels = np.asarray(tiles, dtype=np.float32)
+    if dither:
+        threshold = np.tile(BAYER / 16 - 0.5, (-(-rows // 4), -(-columns // 4)))
+        pixels = pixels + threshold[:rows, :columns, None] * DITHER_SPREAD
+
+    codes, palette = _get_palette(color)
+    distances = (((pixels[:, :, None] - palette) ** 2) * CHANNEL_WEIGHTS).sum(-1)
+    return codes[distances.argmin(-1)].tolist()
+
+
+class TileArtConverter:
+    """Convert images to grids, reusing results for unchanged images."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self.hass = hass
+        self._recent: OrderedDict[tuple[bytes, str, bool], list[list[int]]] = (
+            OrderedDict()
+        )
+
+    async def async_convert(
+        self, image: bytes, color: str, dither: bool = False
+    ) -> list[list[int]]:
+        """Convert an image to a grid for a model."""
+        key = (hashlib.sha256(image).digest(), color, dither)
+        if (grid := self._recent.get(key)) is None:
+            grid = await self.hass.async_add_executor_job(
+                image_to_grid, image, color, dither
+            )
+            self._recent[key] = grid
+            if len(self._recent) > MAX_CONVERTED:
+                self._recent.popitem(last=False)
+        else:
+            self._recent.move_to_end(key)
+        return [list(row) for row in grid]
@@ -0,0 +1,90 @@
+"""Traces of board traffic for the Vestaboard integration.
+
+A recorder appends every read, write and message change of a board to a
+gzipped JSON lines file, which `replay` can drive a coordinator through.
+"""
+
+from __future__ import annotations
+
+import base64
+from datetime import datetime
+import gzip
+import json
+from pathlib import Path
+import time
+from typing import Any, Final
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import DOMAIN
+from .render import pack_grid, unpack_grid
+
+FLUSH_DELAY: Final = 30
+
+TRACE_READ: Final = "read"
+TRACE_WRITE: Final = "write"
+TRACE_PERSISTENT: Final = "persistent"
+TRACE_TEMPORARY: Final = "temporary"
+TRACE_CANCEL: Final = "cancel"
+TRACE_CLEAR: Final = "clear"
+
+
+def encode_grid(data: list[list[int]] | None) -> str | None:
+    """Encode a grid for a trace."""
+    return base64.b64encode(pack_grid(data)).decode() if data else None
+
+
+def decode_grid(encoded: str | None, columns: int) -> list[list[int]] | None:
+    """Decode a grid from a trace."""
+    return unpack_grid(base64.b64decode(encoded), columns) if encoded else None
+
+
+def get_trace_path(hass: HomeAssistant, entry_id: str) -> Path:
+    """Return where the trace of a board is recorded."""
+    return Path(hass.config.path(DOMAIN, "traces", f"{entry_id}.jsonl.gz"))
+
+
+class TraceRecorder:
+    """Record a board's traffic, appending to the trace in batches."""
+
+    def __init__(self, hass: HomeAssistant, path: Path) -> None:
+        """Initialize."""
+        self.hass = hass
+        self.path = path
+        self._pending: list[str] = []
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_record(self, kind: str, **payload: Any) -> None:
+        """Record an event."""
+        self._pending.append(
+            json.dumps([round(time.time(), 3), kind, payload], separators=(",", ":"))
+        )
+        if self._unsub is None:
+            self._unsub = async_call_later(self.hass, FLUSH_DELAY, self._async_flush)
+
+    async def _async_flush(self, now: datetime | None = None) -> None:
+        """Append the recorded events to the trace."""
+        self._unsub = None
+        if lines := self._pending:
+            self._pending = []
+            await self.hass.async_add_executor_job(self._append, lines)
+
+    def _append(self, lines: list[str]) -> None:
+        """Append lines to the trace as a new gzip member."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(self.path, "at", encoding="utf-8") as file:
+            file.writelines(f"{line}\n" for line in lines)
+
+    async def async_stop(self) -> None:
+        """Write any events that are still pending."""
+        if self._unsub:
+            self._unsub()
+        await self._async_flush()
+
+
+def load_trace(path: Path) -> list[tuple[float, str, dict[str, Any]]]:
+    """Load a recorded trace."""
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        return [tuple(json.loads(line)) for line in file if line.strip()]
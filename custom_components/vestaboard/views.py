@@ -0,0 +1,144 @@
+"""HTTP views for the Vestaboard integration."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import gzip
+import hashlib
+from http import HTTPStatus
+from typing import Final
+
+from aiohttp import hdrs, web
+
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+from .coordinator import VestaboardCoordinator
+from .helpers import create_svg
+from .render import DEFAULT_HEIGHT, pack_grid, snap_height
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+CACHE_SIZE: Final = 32
+
+FORMAT_PNG: Final = "png"
+FORMAT_SVG: Final = "svg"
+CONTENT_TYPES: Final = {FORMAT_PNG: "image/png", FORMAT_SVG: "image/svg+xml"}
+
+type Variants = dict[str | None, bytes]
+
+
+@callback
+def async_setup_views(hass: HomeAssistant) -> None:
+    """Register the Vestaboard views."""
+    hass.http.register_view(VestaboardImageView())
+
+
+def _compress(body: bytes) -> Variants:
+    """Return the body with its precompressed variants, keyed by encoding."""
+    variants: Variants = {None: body, "gzip": gzip.compress(body, mtime=0)}
+    if brotli is not None:
+        variants["br"] = brotli.compress(body)
+    return variants
+
+
+def _accepted_encodings(header: str) -> dict[str, float]:
+    """Return the codings of an Accept-Encoding header with their q-values."""
+    accepted: dict[str, float] = {}
+    for item in header.split(","):
+        coding, *params = (part.strip() for part in item.split(";"))
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[coding.lower()] = quality
+    return accepted
+
+
+class VestaboardImageView(HomeAssistantView):
+    """Serve a board image, revalidated with an ETag derived from the grid.
+
+    PNGs are served from the coordinator's size variants and SVGs are cached
+    precompressed by ETag, so polling clients mostly get a 304 and otherwise a
+    cached body.
+    """
+
+    url = "/api/vestaboard/{entry_id}/board.{fmt}"
+    name = "api:vestaboard:board"
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._cache: OrderedDict[str, Variants] = OrderedDict()
+
+    async def get(self, request: web.Request, entry_id: str, fmt: str) -> web.Response:
+        """Return the board image."""
+        hass = request.app[KEY_HASS]
+        if fmt not in CONTENT_TYPES or not (
+            (entry := hass.config_entries.async_get_entry(entry_id))
+            and entry.domain == DOMAIN
+            and entry.state is ConfigEntryState.LOADED
+            and isinstance(coordinator := entry.runtime_data, VestaboardCoordinator)
+            and (data := coordinator.data)
+        ):
+            return web.Response(status=HTTPStatus.NOT_FOUND)
+        try:
+            height = int(request.query.get("height", DEFAULT_HEIGHT))
+        except ValueError:
+            return web.Response(status=HTTPStatus.BAD_REQUEST)
+        # SVGs scale freely, so only PNGs have sizes
+        height = snap_height(height) if fmt == FORMAT_PNG else 0
+
+        digest = hashlib.blake2b(pack_grid(data), digest_size=8)
+        digest.update(f"{coordinator.model}:{fmt}:{height}".encode())
+        etag = f'"{digest.hexdigest()}"'
+        headers = {
+            hdrs.ETAG: etag,
+            hdrs.CACHE_CONTROL: "private, no-cache",
+            hdrs.VARY: hdrs.ACCEPT_ENCODING,
+        }
+        if etag in {
+            tag.strip()
+            for header in request.headers.getall(hdrs.IF_NONE_MATCH, ())
+            for tag in header.split(",")
+        }:
+            return web.Response(status=HTTPStatus.NOT_MODIFIED, headers=headers)
+
+        if fmt == FORMAT_PNG:
+            # Sized variants are cached by the coordinator until the grid changes
+            if not (image := await coordinator.async_get_image(height)):
+                return web.Response(status=HTTPStatus.NOT_FOUND)
+            variants: Variants = {None: image}
+        elif (variants := self._cache.get(etag)) is None:
+            svg = await hass.async_add_executor_job(create_svg, data, coordinator.model)
+            variants = await hass.async_add_executor_job(_compress, svg.encode())
+            self._cache[etag] = variants
+            if len(self._cache) > CACHE_SIZE:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(etag)
+
+        accepted = _accepted_encodings(request.headers.get(hdrs.ACCEPT_ENCODING, ""))
+        qualities = {
+            enc: quality
+            for enc in ("br", "gzip")
+            if enc in variants
+            and (quality := accepted.get(enc, accepted.get("*", 0.0))) > 0
+        }
+        # The client's preference wins, then the smaller brotli body
+        encoding = max(qualities, key=qualities.__getitem__, default=None)
+        if encoding:
+            headers[hdrs.CONTENT_ENCODING] = encoding
+        return web.Response(
+            body=variants[encoding], content_type=CONTENT_TYPES[fmt], headers=headers
+        )
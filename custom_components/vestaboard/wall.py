@@ -0,0 +1,172 @@
+"""Virtual walls of Vestaboards for the Vestaboard integration."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Mapping
+from datetime import datetime
+import logging
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+import homeassistant.util.dt as dt_util
+
+from .const import (
+    ALIGN_CENTER,
+    CONF_ALIGN,
+    CONF_BOARDS,
+    CONF_COLUMNS,
+    CONF_JUSTIFY,
+    CONF_MESSAGE,
+    CONF_VBML,
+    DATA_RENDERER,
+    DOMAIN,
+    MODEL_BLACK,
+)
+from .coordinator import VestaboardCoordinator
+from .helpers import construct_canvas, decode, split_canvas
+from .render import VestaboardRenderer
+from .services import async_show_message
+from .vestaboard_model import VestaboardModel
+
+_LOGGER = logging.getLogger(__name__)
+
+PREVIEW_HEIGHT = 540
+
+type VestaboardWallConfigEntry = ConfigEntry[VestaboardWall]
+
+
+class VestaboardWall(DataUpdateCoordinator[list[list[int]] | None]):
+    """Several Vestaboards mounted together and treated as one canvas.
+
+    Messages are laid out across the whole canvas and split into a grid per
+    board, which are written concurrently so every panel flips together. The
+    canvas and its preview follow what the boards report.
+    """
+
+    config_entry: VestaboardWallConfigEntry
+
+    last_updated: datetime | None = None
+    message: str | None = None
+    image: bytes | None = None
+
+    def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+        """Initialize."""
+        super().__init__(
+            hass, _LOGGER, config_entry=config_entry, name=f"{DOMAIN}_wall"
+        )
+        self.board_ids: list[str] = config_entry.data[CONF_BOARDS]
+        self.columns: int = config_entry.data[CONF_COLUMNS]
+        self.renderer: VestaboardRenderer = hass.data[DOMAIN][DATA_RENDERER]
+        self.boards: list[VestaboardCoordinator] = []
+        self.board_model = VestaboardModel.from_name(MODEL_BLACK)
+        self._unsubs: list[CALLBACK_TYPE] = []
+
+    @property
+    def rows(self) -> int:
+        """Return the number of rows of boards."""
+        return len(self.board_ids) // self.columns
+
+    @property
+    def canvas_size(self) -> tuple[int, int]:
+        """Return the rows and columns of characters across the wall."""
+        return (
+            self.rows * self.board_model.rows,
+            self.columns * self.board_model.columns,
+        )
+
+    @callback
+    def async_setup(self) -> None:
+        """Find the boards and follow their updates."""
+        boards = []
+        for entry_id in self.board_ids:
+            entry = self.hass.config_entries.async_get_entry(entry_id)
+            if entry is None or entry.state is not ConfigEntryState.LOADED:
+                raise HomeAssistantError(f"Vestaboard {entry_id} isn't loaded")
+            boards.append(entry.runtime_data)
+        if len({board.model for board in boards}) > 1:
+            raise HomeAssistantError("Every board on a wall must be the same model")
+        self.boards = boards
+        self.board_model = VestaboardModel.from_name(boards[0].model)
+        self._unsubs = [
+            board.async_add_listener(self._async_handle_board_update)
+            for board in boards
+        ]
+        self._async_handle_board_update()
+
+    async def _async_update_data(self) -> list[list[int]] | None:
+        """Return the canvas, which is only updated by the boards."""
+        return self.data
+
+    @callback
+    def async_unload(self) -> None:
+        """Stop following the boards."""
+        while self._unsubs:
+            self._unsubs.pop()()
+
+    def _canvas(self) -> list[list[int]] | None:
+        """Return the canvas the boards currently show."""
+        if any(board.data is None for board in self.boards):
+            return None
+        return [
+            [
+                code
+                for board in self.boards[top : top + self.columns]
+                for code in board.data[row]
+            ]
+            for top in range(0, len(self.boards), self.columns)
+            for row in range(self.board_model.rows)
+        ]
+
+    @callback
+    def _async_handle_board_update(self) -> None:
+        """Rebuild the canvas from the boards, rendering a new preview if it changed."""
+        if (canvas := self._canvas()) is not None and canvas != self.data:
+            self.config_entry.async_create_background_task(
+                self.hass, self._async_update_preview(canvas), "vestaboard wall preview"
+            )
+
+    async def _async_update_preview(self, canvas: list[list[int]]) -> None:
+        """Render the wall as a single preview image."""
+        grids = split_canvas(canvas, self.board_model.rows, self.board_model.columns)
+        image = await self.renderer.async_render_batch(
+            grids, self.board_model.name, PREVIEW_HEIGHT, columns=self.columns
+        )
+        # Boards written together update one at a time, so a render of a
+        # partly written canvas can finish after the render of the whole one
+        if canvas != self._canvas():
+            return
+        self.last_updated = dt_util.now()
+        self.message = decode(canvas)
+        self.image = image
+        self.async_set_updated_data(canvas)
+
+    async def async_show_message(self, data: Mapping[str, Any]) -> None:
+        """Lay a message out across the wall and write it to every board at once."""
+        rows, columns = self.canvas_size
+        if data.get(CONF_VBML):
+            raise HomeAssistantError("VBML can only be composed for a single board")
+        try:
+            canvas = construct_canvas(
+                data.get(CONF_MESSAGE, ""),
+                rows,
+                columns,
+                justify=data.get(CONF_JUSTIFY, ALIGN_CENTER),
+                align=data.get(CONF_ALIGN, ALIGN_CENTER),
+            )
+        except ValueError as err:
+            raise HomeAssistantError(f"Unable to lay out message: {err}") from err
+        grids = split_canvas(canvas, self.board_model.rows, self.board_model.columns)
+
+        results = await asyncio.gather(
+            *(
+                async_show_message(board, grid, data)
+                for board, grid in zip(self.boards, grids)
+            ),
+            return_exceptions=True,
+        )
+        if errors := [str(err) for err in results if isinstance(err, Exception)]:
+            raise HomeAssistantError("; ".join(errors))
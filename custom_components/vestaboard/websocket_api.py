@@ -0,0 +1,86 @@
+"""WebSocket API for the Vestaboard integration."""
+
+from __future__ import annotations
+
+from typing import Any, Final
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_DEVICE_ID
+from homeassistant.core import HomeAssistant, callback
+
+from .helpers import async_get_coordinator_by_device_id, diff_grid, same_shape
+
+ERR_UNLOADED: Final = "unloaded"
+
+
+@callback
+def async_setup_websocket_api(hass: HomeAssistant) -> None:
+    """Set up the Vestaboard WebSocket API."""
+    websocket_api.async_register_command(hass, websocket_subscribe)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "vestaboard/subscribe",
+        vol.Required(CONF_DEVICE_ID): str,
+    }
+)
+@callback
+def websocket_subscribe(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Stream a board's grid, sending only changed cells after the first event."""
+    try:
+        coordinator = async_get_coordinator_by_device_id(hass, msg[CONF_DEVICE_ID])
+    except ValueError as err:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, str(err))
+        return
+
+    sent = coordinator.data
+
+    @callback
+    def _async_forward_update() -> None:
+        """Send the cells that changed since the last event."""
+        nonlocal sent
+        if (data := coordinator.data) is None or data == sent:
+            return
+        if sent is None or not same_shape(sent, data):
+            event = {"grid": data}
+        else:
+            event = {"delta": diff_grid(sent, data)}
+        sent = data
+        connection.send_message(websocket_api.event_message(msg["id"], event))
+
+    entry = coordinator.config_entry
+    unsub_listener = coordinator.async_add_listener(_async_forward_update)
+
+    @callback
+    def _async_entry_state_changed() -> None:
+        """End the subscription when the board is unloaded, such as to reload."""
+        if entry.state is ConfigEntryState.LOADED:
+            return
+        if connection.subscriptions.pop(msg["id"], None) is None:
+            return
+        unsub_listener()
+        # State change listeners are being iterated, so remove this one after
+        hass.loop.call_soon(unsub_state)
+        connection.send_error(
+            msg["id"], ERR_UNLOADED, "Vestaboard was unloaded, subscribe again"
+        )
+
+    unsub_state = entry.async_on_state_change(_async_entry_state_changed)
+
+    @callback
+    def _async_unsubscribe() -> None:
+        """Stop streaming the board."""
+        unsub_listener()
+        unsub_state()
+
+    connection.subscriptions[msg["id"]] = _async_unsubscribe
+    connection.send_result(msg["id"])
+    connection.send_message(websocket_api.event_message(msg["id"], {"grid": sent}))
@@ -0,0 +1,318 @@
+"""Soak test many Vestaboards in one Home Assistant process.
+
+Starts Home Assistant's test core with a config entry for each of many fake
+boards, then advances simulated time through hours of polling, temporary
+message expirations, broadcasts and boards changed by other apps. Reports
+event loop lag, executor saturation, memory per board and state writes per
+minute. Needs the development requirements, run from the repository root::
+
+    python scripts/soak.py --boards 200 --hours 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import timedelta
+import gc
+import json
+from pathlib import Path
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import tracemalloc
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+from freezegun import freeze_time
+import freezegun.api
+import httpx
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+    async_test_home_assistant,
+)
+
+from homeassistant import loader
+from homeassistant.const import EVENT_STATE_CHANGED, EVENT_STATE_REPORTED
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.runner import MAX_EXECUTOR_WORKERS
+import homeassistant.util.dt as dt_util
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from custom_components.vestaboard.const import DOMAIN
+from custom_components.vestaboard.helpers import construct_message
+
+
+def _real_perf_counter() -> float:
+    """Return the performance counter, which is frozen with the clock."""
+    return freezegun.api.real_perf_counter()
+
+
+class LagProbe:
+    """Measure how late the event loop runs a callback it is handed.
+
+    The loop's clock is frozen with the rest of time, so its timers can't
+    measure lag. Instead a thread on the real clock hands the loop a callback
+    every interval and the callback records how long it waited to run.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, interval: float) -> None:
+        """Initialize."""
+        self.lags: list[float] = []
+        self._loop = loop
+        self._interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="LagProbe")
+
+    def start(self) -> None:
+        """Start probing."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop probing."""
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        """Hand the loop a callback every interval."""
+        while not self._stop.wait(self._interval):
+            self._loop.call_soon_threadsafe(self._record, _real_perf_counter())
+
+    def _record(self, sent: float) -> None:
+        """Record how long a callback waited to run."""
+        self.lags.append((_real_perf_counter() - sent) * 1000)
+
+
+WORDS = ("GOOD MORNING", "STANDUP IN 5", "LUNCH IS HERE", "DEPLOY DONE", "HELLO")
+
+
+class FakeBoard:
+    """In-process stand-in for a `LocalClient`."""
+
+    def __init__(self, host: str) -> None:
+        """Initialize."""
+        self.rows = construct_message(random.choice(WORDS))
+        self.http = SimpleNamespace(base_url=httpx.URL(f"http://{host}:7000"))
+        self.api_key = "soak"
+        self.reads = 0
+        self.writes = 0
+
+    def read_message(self) -> list[list[int]]:
+        """Return the displayed grid."""
+        self.reads += 1
+        return self.rows
+
+    def write_message(self, rows: list[list[int]]) -> None:
+        """Display a grid."""
+        self.writes += 1
+        self.rows = rows
+
+
+@dataclass(slots=True)
+class SoakReport:
+    """What running the fleet cost."""
+
+    boards: int
+    simulated_minutes: int
+    wall_seconds: float
+    reads: int
+    writes: int
+    loop_lag_ms: dict[str, float]
+    executor_max_in_flight: int
+    executor_workers: int
+    memory_growth_kib_per_board: float
+    retained_png_kib_per_board: float
+    state_writes_per_minute: float
+
+
+def _retained_png_bytes(hass: HomeAssistant) -> int:
+    """Return the PNG bytes held by every board."""
+    total = 0
+    for entry in hass.config_entries.async_loaded_entries(DOMAIN):
+        coordinator = entry.runtime_data
+        total += len(coordinator.image or b"") + len(coordinator.transition or b"")
+        if variants := coordinator._image_variants:
+            task = variants[1]
+            if task.done() and not task.exception():
+                total += sum(map(len, task.result().values()))
+    return total
+
+
+async def async_soak(args: argparse.Namespace) -> SoakReport:
+    """Run the soak test."""
+    random.seed(args.seed)
+    boards = [FakeBoard(f"10.0.{i // 250}.{i % 250 + 1}") for i in range(args.boards)]
+    state_writes = 0
+    in_flight = max_in_flight = 0
+    loop = asyncio.get_running_loop()
+    # Jobs get as many workers as Home Assistant gives them
+    loop.set_default_executor(
+        ThreadPoolExecutor(
+            thread_name_prefix="SyncWorker", max_workers=args.executor_workers
+        )
+    )
+    probe = LagProbe(loop, args.probe_interval / 1000)
+
+    with (
+        tempfile.TemporaryDirectory() as config_dir,
+        freeze_time(dt_util.utcnow()) as frozen,
+    ):
+        async with async_test_home_assistant(config_dir=config_dir) as hass:
+            hass.data.pop(loader.DATA_CUSTOM_COMPONENTS)
+
+            @callback
+            def _async_count_state_write(event: Event) -> None:
+                nonlocal state_writes
+                state_writes += 1
+
+            @callback
+            def _async_any_state(event_data: Mapping[str, Any]) -> bool:
+                return True
+
+            hass.bus.async_listen(EVENT_STATE_CHANGED, _async_count_state_write)
+            hass.bus.async_listen(
+                EVENT_STATE_REPORTED,
+                _async_count_state_write,
+                event_filter=_async_any_state,
+            )
+
+            clients = iter(boards)
+            with patch(
+                "custom_components.vestaboard.create_client",
+                side_effect=lambda data: next(clients),
+            ):
+                for board in boards:
+                    entry = MockConfigEntry(
+                        domain=DOMAIN,
+                        title=board.http.base_url.host,
+                        data={"host": board.http.base_url.host, "api_key": "soak"},
+                        options=args.options,
+                    )
+                    entry.add_to_hass(hass)
+                    await hass.config_entries.async_setup(entry.entry_id)
+                await hass.async_block_till_done()
+
+            registry = dr.async_get(hass)
+            device_ids = [
+                device.id
+                for entry in hass.config_entries.async_entries(DOMAIN)
+                for device in dr.async_entries_for_config_entry(
+                    registry, entry.entry_id
+                )
+            ]
+            async_add_executor_job = hass.async_add_executor_job
+
+            @callback
+            def _async_job_done(future: asyncio.Future[Any]) -> None:
+                nonlocal in_flight
+                in_flight -= 1
+
+            @callback
+            def _async_add_executor_job(target: Any, *args: Any) -> asyncio.Future[Any]:
+                nonlocal in_flight, max_in_flight
+                future = async_add_executor_job(target, *args)
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                future.add_done_callback(_async_job_done)
+                return future
+
+            # Jobs waiting for a worker show how saturated the executor is
+            hass.async_add_executor_job = _async_add_executor_job
+
+            gc.collect()
+            tracemalloc.start()
+            baseline = tracemalloc.get_traced_memory()[0]
+            state_writes = 0
+            wall = _real_perf_counter()
+            probe.start()
+
+            minutes = int(args.hours * 60)
+            for minute in range(1, minutes + 1):
+                seconds = minute * 60
+                if seconds % args.broadcast_interval == 0:
+                    hass.async_create_task(
+                        hass.services.async_call(
+                            DOMAIN,
+                            "message",
+                            {"device_id": device_ids, "message": random.choice(WORDS)},
+                        )
+                    )
+                if seconds % args.temporary_interval == 0:
+                    hass.async_create_task(
+                        hass.services.async_call(
+                            DOMAIN,
+                            "message",
+                            {
+                                "device_id": random.sample(
+                                    device_ids, max(len(device_ids) // 10, 1)
+                                ),
+                                "message": f"ALERT {minute}",
+                                "duration": random.randint(60, 900),
+                            },
+                        )
+                    )
+                # Other apps change a few boards behind our back
+                for board in random.sample(boards, max(len(boards) // 50, 1)):
+                    board.rows = construct_message(random.choice(WORDS))
+
+                # Advance in poll sized steps so every timer fires on time
+                for _ in range(4):
+                    frozen.tick(timedelta(seconds=15))
+                    async_fire_time_changed(hass)
+                    await hass.async_block_till_done(wait_background_tasks=True)
+
+            probe.stop()
+            wall = _real_perf_counter() - wall
+            gc.collect()
+            growth = tracemalloc.get_traced_memory()[0] - baseline
+            tracemalloc.stop()
+            retained = _retained_png_bytes(hass)
+
+            lags = sorted(probe.lags) or [0.0]
+            report = SoakReport(
+                boards=len(boards),
+                simulated_minutes=minutes,
+                wall_seconds=round(wall, 2),
+                reads=sum(board.reads for board in boards),
+                writes=sum(board.writes for board in boards),
+                loop_lag_ms={
+                    "median": round(statistics.median(lags), 2),
+                    "p95": round(lags[int(len(lags) * 0.95)], 2),
+                    "max": round(lags[-1], 2),
+                },
+                executor_max_in_flight=max_in_flight,
+                executor_workers=args.executor_workers,
+                memory_growth_kib_per_board=round(growth / 1024 / len(boards), 1),
+                retained_png_kib_per_board=round(retained / 1024 / len(boards), 1),
+                state_writes_per_minute=round(state_writes / minutes, 1),
+            )
+            await hass.async_stop(force=True)
+    return report
+
+
+def main() -> None:
+    """Run the soak test from the command line and print the report."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--boards", type=int, default=100)
+    parser.add_argument("--hours", type=float, default=4)
+    parser.add_argument("--broadcast-interval", type=int, default=1800)
+    parser.add_argument("--temporary-interval", type=int, default=300)
+    parser.add_argument("--options", type=json.loads, default={"model": "black"})
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--executor-workers", type=int, default=MAX_EXECUTOR_WORKERS)
+    parser.add_argument("--probe-interval", type=float, default=10, help="milliseconds")
+    report = asyncio.run(async_soak(parser.parse_args()))
+    print(json.dumps(asdict(report), indent=2))
+
+
+if __name__ == "__main__":
+    main()